@@ -4,42 +4,65 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    from scripts.idml_common import dumps, iter_records
+except ImportError:  # run directly as scripts/align_story_text.py
+    from idml_common import dumps, iter_records
+
 
 def _load_records(path: Path) -> Dict[str, List[dict]]:
-    stories: Dict[str, List[dict]] = {}
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            rec = json.loads(line)
-            story = rec.get("story")
-            if not story:
-                continue
-            stories.setdefault(story, []).append(rec)
-    for story, recs in stories.items():
-        recs.sort(key=lambda r: int(r.get("index", 0)))
+    stories: Dict[str, List[dict]] = defaultdict(list)
+    for rec in iter_records(path):
+        story = rec.get("story")
+        if not story or not isinstance(story, str):
+            continue
+        story = sys.intern(story)
+        rec["story"] = story
+        rec["_index"] = int(rec.get("index", 0))
+        # Scoring fields, computed once: (stripped text length, paragraph style, character style)
+        rec["_score_key"] = (
+            len((rec.get("text") or "").strip()),
+            rec.get("paragraph_style") or None,
+            rec.get("character_style") or None,
+        )
+        stories[story].append(rec)
+    by_index = itemgetter("_index")
+    for recs in stories.values():
+        recs.sort(key=by_index)
     return stories
 
 
-def _score(en: dict, km: dict) -> float:
+@lru_cache(maxsize=None)
+def _score_cached(en_len: int, km_len: int, p_match: bool, c_match: bool) -> float:
     score = 0.0
-    if en.get("paragraph_style") and en.get("paragraph_style") == km.get("paragraph_style"):
+    if p_match:
         score += 0.4
-    if en.get("character_style") and en.get("character_style") == km.get("character_style"):
+    if c_match:
         score += 0.2
-    en_text = (en.get("text") or "").strip()
-    km_text = (km.get("text") or "").strip()
-    if en_text and km_text:
-        ratio = min(len(en_text), len(km_text)) / max(len(en_text), len(km_text))
+    if en_len and km_len:
+        ratio = min(en_len, km_len) / max(en_len, km_len)
         score += 0.4 * ratio
     return round(score, 3)
 
 
+def _score(en: dict, km: dict) -> float:
+    en_len, en_p, en_c = en["_score_key"]
+    km_len, km_p, km_c = km["_score_key"]
+    return _score_cached(
+        en_len,
+        km_len,
+        en_p is not None and en_p == km_p,
+        en_c is not None and en_c == km_c,
+    )
+
+
 def _scaled_index(i: int, en_count: int, km_count: int) -> int:
     if en_count <= 1:
         return 0
@@ -59,7 +82,7 @@ def main() -> int:
     stories = sorted(set(en) | set(km))
     out_path = Path(args.out)
 
-    with out_path.open("w", encoding="utf-8") as f:
+    with out_path.open("wb") as f:
         for story in stories:
             en_list = en.get(story, [])
             km_list = km.get(story, [])
@@ -81,7 +104,7 @@ def main() -> int:
                         "score": _score(e, k),
                         "method": "index",
                     }
-                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                    f.write(dumps(rec) + b"\n")
                 continue
 
             used_km = set()
@@ -96,7 +119,7 @@ def main() -> int:
                         "score": 0.0,
                         "method": "missing-km",
                     }
-                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                    f.write(dumps(rec) + b"\n")
                     continue
 
                 j = _scaled_index(i, len(en_list), len(km_list))
@@ -116,7 +139,7 @@ def main() -> int:
                     "score": _score(e, k),
                     "method": "scaled",
                 }
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                f.write(dumps(rec) + b"\n")
 
             for j, k in enumerate(km_list):
                 if j in used_km:
@@ -130,7 +153,7 @@ def main() -> int:
                     "score": 0.0,
                     "method": "missing-en",
                 }
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                f.write(dumps(rec) + b"\n")
 
     print(f"Wrote alignment to {out_path}")
     return 0
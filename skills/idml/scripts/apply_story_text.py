@@ -4,31 +4,28 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Iterator, Tuple
+from typing import Iterable, Iterator, Tuple
 
 try:
     from defusedxml import ElementTree as ET
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
-
-def _iter_records(path: Path) -> Iterator[dict]:
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            yield json.loads(line)
+try:
+    from scripts.idml_common import iter_records
+except ImportError:  # run directly as scripts/apply_story_text.py
+    from idml_common import iter_records
 
 
 def _strip_ns(tag: str) -> str:
     return tag.split("}", 1)[-1] if "}" in tag else tag
 
 
-def _walk_content_nodes(root: ET.Element) -> Iterator[ET.Element]:
-    for elem in root.iter():
+def _walk_content_nodes(context: Iterable[Tuple[str, ET.Element]]) -> Iterator[ET.Element]:
+    for _, elem in context:
         if _strip_ns(elem.tag) == "Content":
             yield elem
 
@@ -46,28 +43,33 @@ def main() -> int:
         raise SystemExit(f"Stories directory not found: {stories_dir}")
 
     # Build mapping: story -> index -> translation
-    mapping: dict[str, dict[int, str]] = {}
-    for rec in _iter_records(Path(args.translations)):
+    mapping: dict[str, dict[int, str]] = defaultdict(dict)
+    for rec in iter_records(Path(args.translations)):
         story = rec.get("story")
         idx = rec.get("index")
         translated = rec.get(args.field)
-        if story is None or idx is None or translated is None:
+        if not isinstance(story, str) or idx is None or translated is None:
             continue
-        mapping.setdefault(story, {})[int(idx)] = str(translated)
+        mapping[sys.intern(story)][int(idx)] = str(translated)
 
     updated = 0
-    for story_path in sorted(stories_dir.glob("*.xml")):
-        if story_path.name not in mapping:
+    for story_name in sorted(mapping):
+        story_path = stories_dir / story_name
+        # Story names come from the JSONL; only accept plain file names
+        if story_path.name != story_name or not story_path.is_file():
             continue
-        tree = ET.parse(story_path)
-        root_el = tree.getroot()
+        trans = mapping[story_name]
+        context = ET.iterparse(str(story_path), events=("end",))
         idx = 0
-        for content in _walk_content_nodes(root_el):
-            if idx in mapping[story_path.name]:
-                content.text = mapping[story_path.name][idx]
-                updated += 1
+        changed = 0
+        for content in _walk_content_nodes(context):
+            if idx in trans:
+                content.text = trans[idx]
+                changed += 1
             idx += 1
-        tree.write(story_path, encoding="utf-8", xml_declaration=True)
+        if changed:
+            story_path.write_bytes(ET.tostring(context.root, encoding="utf-8", xml_declaration=True))
+            updated += changed
 
     print(f"Updated {updated} content nodes")
     return 0
@@ -7,13 +7,21 @@ import argparse
 import json
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 try:
     from defusedxml import ElementTree as ET
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
+try:
+    from scripts.idml_common import xml_files
+except ImportError:  # run directly as scripts/check_resources.py
+    from idml_common import xml_files
+
+# Heuristic: attribute values that look like file paths
+_LINK_RE = re.compile(rb'="([^"]+\.(?:png|jpg|jpeg|tif|tiff|pdf|eps|ai|psd))"', re.IGNORECASE)
+
 
 def _strip_ns(tag: str) -> str:
     return tag.split("}", 1)[-1] if "}" in tag else tag
@@ -28,17 +36,15 @@ def _list_fonts(fonts_xml: Path) -> Dict[str, List[str]]:
     except Exception:
         return families
     root = tree.getroot()
-    for fam in root.iter():
-        if _strip_ns(fam.tag) == "FontFamily":
-            name = fam.attrib.get("Name") or fam.attrib.get("Self")
-            if not name:
-                continue
-            families.setdefault(name, [])
-            for child in list(fam):
-                if _strip_ns(child.tag) == "Font":
-                    fam_name = child.attrib.get("FontStyleName") or child.attrib.get("Name")
-                    if fam_name:
-                        families[name].append(fam_name)
+    for fam in root.iterfind(".//{*}FontFamily"):
+        name = fam.attrib.get("Name") or fam.attrib.get("Self")
+        if not name:
+            continue
+        families.setdefault(name, [])
+        for child in fam.iterfind("{*}Font"):
+            fam_name = child.attrib.get("FontStyleName") or child.attrib.get("Name")
+            if fam_name:
+                families[name].append(fam_name)
     return families
 
 
@@ -58,11 +64,9 @@ def _count_styles(styles_xml: Path) -> Dict[str, int]:
     return counts
 
 
-def _extract_links_any(xml_path: Path) -> List[str]:
-    text = xml_path.read_text(encoding="utf-8", errors="ignore")
-    # Heuristic: find attribute values that look like file paths
-    links = re.findall(r'="([^"]+\.(?:png|jpg|jpeg|tif|tiff|pdf|eps|ai|psd))"', text, flags=re.IGNORECASE)
-    return sorted(set(links))
+def _extract_links_any(xml_path: Path) -> Set[str]:
+    data = xml_path.read_bytes()
+    return {m.decode("utf-8", errors="ignore") for m in _LINK_RE.findall(data)}
 
 
 def main() -> int:
@@ -84,18 +88,16 @@ def main() -> int:
     report["fonts"] = _list_fonts(res / "Fonts.xml")
     report["style_counts"] = _count_styles(res / "Styles.xml")
 
-    link_candidates = []
-    links_xml = res / "Links.xml"
-    if links_xml.is_file():
-        link_candidates.extend(_extract_links_any(links_xml))
-    else:
+    if not (res / "Links.xml").is_file():
         report["notes"].append("Resources/Links.xml not found")
 
-    # Scan all resource XML for potential links
-    for xml_path in res.glob("*.xml"):
-        link_candidates.extend(_extract_links_any(xml_path))
+    # Scan all resource XML (including Links.xml) for potential links
+    link_set: Set[str] = set()
+    if res.is_dir():
+        for xml_path in xml_files(res):
+            link_set.update(_extract_links_any(xml_path))
 
-    links = sorted(set(link_candidates))
+    links = sorted(link_set)
     report["links"] = links
 
     # Check Links/ directory for missing assets if present
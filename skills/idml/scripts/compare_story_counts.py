@@ -5,23 +5,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict
 
+try:
+    from scripts.idml_common import iter_records
+except ImportError:  # run directly as scripts/compare_story_counts.py
+    from idml_common import iter_records
+
 
 def _load_counts(path: Path) -> Dict[str, int]:
-    counts: Dict[str, int] = {}
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            rec = json.loads(line)
-            story = rec.get("story")
-            if not story:
-                continue
-            counts[story] = counts.get(story, 0) + 1
-    return counts
+    stories = (rec.get("story") for rec in iter_records(path))
+    return Counter(sys.intern(story) for story in stories if story and isinstance(story, str))
 
 
 def main() -> int:
@@ -9,14 +9,14 @@ from pathlib import Path
 from typing import Dict, List
 
 
-def _write_section(f, title: str, items: List[str]) -> None:
-    f.write(f"## {title}\n")
+def _write_section(out: List[str], title: str, items: List[str]) -> None:
+    out.append(f"## {title}\n")
     if not items:
-        f.write("- [x] None\n\n")
+        out.append("- [x] None\n\n")
         return
     for item in items:
-        f.write(f"- [ ] {item}\n")
-    f.write("\n")
+        out.append(f"- [ ] {item}\n")
+    out.append("\n")
 
 
 def main() -> int:
@@ -37,34 +37,36 @@ def main() -> int:
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with out_path.open("w", encoding="utf-8") as f:
-        f.write("# Observed Schema Coverage Checklist\n\n")
-        f.write("Use this checklist to expand sample coverage.\n")
-        f.write("The items below are present in the baseline schema but missing in the new sample.\n\n")
-
-        _write_section(f, "Missing Elements", removed_elements)
-
-        missing_attr_items = [f"{element}: {', '.join(attrs)}" for element, attrs in removed_attrs.items()]
-        _write_section(f, "Missing Attributes", missing_attr_items)
-
-        missing_child_items = [f"{element}: {', '.join(children)}" for element, children in removed_children.items()]
-        _write_section(f, "Missing Child Elements", missing_child_items)
-
-        if added_elements or added_attrs or added_children:
-            f.write("## New Elements/Attributes in Sample\n")
-            if added_elements:
-                f.write("### Added Elements\n")
-                for item in added_elements:
-                    f.write(f"- {item}\n")
-            if added_attrs:
-                f.write("### Added Attributes\n")
-                for element, attrs in added_attrs.items():
-                    f.write(f"- {element}: {', '.join(attrs)}\n")
-            if added_children:
-                f.write("### Added Child Elements\n")
-                for element, children in added_children.items():
-                    f.write(f"- {element}: {', '.join(children)}\n")
-            f.write("\n")
+    out: List[str] = []
+    out.append("# Observed Schema Coverage Checklist\n\n")
+    out.append("Use this checklist to expand sample coverage.\n")
+    out.append("The items below are present in the baseline schema but missing in the new sample.\n\n")
+
+    _write_section(out, "Missing Elements", removed_elements)
+
+    missing_attr_items = [f"{element}: {', '.join(attrs)}" for element, attrs in removed_attrs.items()]
+    _write_section(out, "Missing Attributes", missing_attr_items)
+
+    missing_child_items = [f"{element}: {', '.join(children)}" for element, children in removed_children.items()]
+    _write_section(out, "Missing Child Elements", missing_child_items)
+
+    if added_elements or added_attrs or added_children:
+        out.append("## New Elements/Attributes in Sample\n")
+        if added_elements:
+            out.append("### Added Elements\n")
+            for item in added_elements:
+                out.append(f"- {item}\n")
+        if added_attrs:
+            out.append("### Added Attributes\n")
+            for element, attrs in added_attrs.items():
+                out.append(f"- {element}: {', '.join(attrs)}\n")
+        if added_children:
+            out.append("### Added Child Elements\n")
+            for element, children in added_children.items():
+                out.append(f"- {element}: {', '.join(children)}\n")
+        out.append("\n")
+
+    out_path.write_text("".join(out), encoding="utf-8")
 
     print(f"Wrote checklist to {out_path}")
     return 0
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
@@ -23,10 +24,6 @@ def _labelled_args(items: List[str]) -> List[Tuple[str, Path]]:
     return labelled
 
 
-def _append_missing(mapping: Dict[str, Set[str]], key: str, label: str) -> None:
-    mapping.setdefault(key, set()).add(label)
-
-
 def main() -> int:
     parser = argparse.ArgumentParser(description="Combine schema delta reports into a coverage plan")
     parser.add_argument(
@@ -39,9 +36,9 @@ def main() -> int:
 
     labelled = _labelled_args(args.inputs)
 
-    missing_elements: Dict[str, Set[str]] = {}
-    missing_attrs: Dict[str, Set[str]] = {}
-    missing_children: Dict[str, Set[str]] = {}
+    missing_elements: Dict[str, Set[str]] = defaultdict(set)
+    missing_attrs: Dict[str, Set[str]] = defaultdict(set)
+    missing_children: Dict[str, Set[str]] = defaultdict(set)
 
     summary: Dict[str, dict] = {}
 
@@ -58,45 +55,47 @@ def main() -> int:
         }
 
         for element in removed_elements:
-            _append_missing(missing_elements, element, label)
+            missing_elements[element].add(label)
 
         for element, attrs in removed_attrs.items():
             for attr in attrs:
-                _append_missing(missing_attrs, f"{element}::{attr}", label)
+                missing_attrs[f"{element}::{attr}"].add(label)
 
         for element, children in removed_children.items():
             for child in children:
-                _append_missing(missing_children, f"{element}::{child}", label)
+                missing_children[f"{element}::{child}"].add(label)
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _write_section(f, title: str, mapping: Dict[str, Set[str]]) -> None:
-        f.write(f"## {title}\n")
+    def _write_section(out: List[str], title: str, mapping: Dict[str, Set[str]]) -> None:
+        out.append(f"## {title}\n")
         if not mapping:
-            f.write("- [x] None\n\n")
+            out.append("- [x] None\n\n")
             return
         for key in sorted(mapping.keys()):
             labels = ", ".join(sorted(mapping[key]))
-            f.write(f"- [ ] {key} (missing in: {labels})\n")
-        f.write("\n")
-
-    with out_path.open("w", encoding="utf-8") as f:
-        f.write("# Observed Schema Coverage Plan (Combined)\n\n")
-        f.write("This plan lists items missing from one or more sample sets.\n\n")
-        f.write("## Summary\n")
-        for label in sorted(summary.keys()):
-            stats = summary[label]
-            f.write(
-                f"- {label}: elements={stats['missing_elements']}, "
-                f"attributes={stats['missing_attributes']}, "
-                f"children={stats['missing_children']}\n"
-            )
-        f.write("\n")
-
-        _write_section(f, "Missing Elements", missing_elements)
-        _write_section(f, "Missing Attributes", missing_attrs)
-        _write_section(f, "Missing Child Elements", missing_children)
+            out.append(f"- [ ] {key} (missing in: {labels})\n")
+        out.append("\n")
+
+    out: List[str] = []
+    out.append("# Observed Schema Coverage Plan (Combined)\n\n")
+    out.append("This plan lists items missing from one or more sample sets.\n\n")
+    out.append("## Summary\n")
+    for label in sorted(summary.keys()):
+        stats = summary[label]
+        out.append(
+            f"- {label}: elements={stats['missing_elements']}, "
+            f"attributes={stats['missing_attributes']}, "
+            f"children={stats['missing_children']}\n"
+        )
+    out.append("\n")
+
+    _write_section(out, "Missing Elements", missing_elements)
+    _write_section(out, "Missing Attributes", missing_attrs)
+    _write_section(out, "Missing Child Elements", missing_children)
+
+    out_path.write_text("".join(out), encoding="utf-8")
 
     print(f"Wrote coverage plan to {out_path}")
     return 0
@@ -4,45 +4,108 @@
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
+import os
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Iterator, Tuple
+from typing import Iterator, Tuple
 
 try:
     from defusedxml import ElementTree as ET
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
+try:
+    from scripts.idml_common import add_jobs_argument, dumps, map_paths, xml_files
+except ImportError:  # run directly as scripts/extract_story_text.py
+    from idml_common import add_jobs_argument, dumps, map_paths, xml_files
+
+# Part of the --cache-dir key; bump whenever the emitted record format changes
+# so extracts cached by an older version are not reused
+_CACHE_FORMAT_VERSION = 1
 
-def _iter_stories(stories_dir: Path) -> Iterable[Path]:
-    return sorted(stories_dir.glob("*.xml"))
 
+def _walk_content(story_path: Path) -> Iterator[Tuple[str, str, str]]:
+    """Yield (paragraph_style, character_style, text) for each Content node.
 
-def _walk_content(root: ET.Element) -> Iterator[Tuple[str, str, str]]:
-    """Yield (paragraph_style, character_style, text) for each Content node."""
-    def recurse(elem: ET.Element, p_style: str, c_style: str):
+    Streams the story with iterparse, tracking the applied styles on a stack
+    and clearing each element once it has been handled.
+    """
+    p_styles = [""]
+    c_styles = [""]
+    for event, elem in ET.iterparse(str(story_path), events=("start", "end")):
         tag = _strip_ns(elem.tag)
+        if event == "start":
+            if tag == "ParagraphStyleRange":
+                p_styles.append(elem.attrib.get("AppliedParagraphStyle", p_styles[-1]))
+            elif tag == "CharacterStyleRange":
+                c_styles.append(elem.attrib.get("AppliedCharacterStyle", c_styles[-1]))
+            continue
         if tag == "ParagraphStyleRange":
-            p_style = elem.attrib.get("AppliedParagraphStyle", p_style)
-        if tag == "CharacterStyleRange":
-            c_style = elem.attrib.get("AppliedCharacterStyle", c_style)
-        if tag == "Content":
-            text = elem.text or ""
-            yield (p_style, c_style, text)
-        for child in list(elem):
-            yield from recurse(child, p_style, c_style)
-
-    yield from recurse(root, "", "")
+            p_styles.pop()
+        elif tag == "CharacterStyleRange":
+            c_styles.pop()
+        elif tag == "Content":
+            yield (p_styles[-1], c_styles[-1], elem.text or "")
+        elem.clear()
 
 
 def _strip_ns(tag: str) -> str:
     return tag.split("}", 1)[-1] if "}" in tag else tag
 
 
+def _story_jsonl(story_path: Path) -> Tuple[bytes, int]:
+    """Return the JSONL lines and record count for one story; raises if unparsable."""
+    lines = []
+    for idx, (p_style, c_style, text) in enumerate(_walk_content(story_path)):
+        rec = {
+            "id": f"{story_path.name}::{idx}",
+            "story": story_path.name,
+            "index": idx,
+            "paragraph_style": p_style,
+            "character_style": c_style,
+            "text": text,
+        }
+        lines.append(dumps(rec) + b"\n")
+    return b"".join(lines), len(lines)
+
+
+def _process_story(story_path: Path) -> Tuple[bytes, int]:
+    """Return the JSONL lines and record count for one story (empty if unparsable)."""
+    try:
+        return _story_jsonl(story_path)
+    except Exception:
+        return b"", 0
+
+
+def _process_story_cached(story_path: Path, cache_dir: Path) -> Tuple[bytes, int]:
+    """Like _process_story, reusing JSONL cached for the same (format, path, mtime, size)."""
+    st = story_path.stat()
+    key = f"{_CACHE_FORMAT_VERSION}\0{story_path.resolve()}\0{st.st_mtime_ns}\0{st.st_size}"
+    cached = cache_dir / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".jsonl")
+    if cached.is_file():
+        data = cached.read_bytes()
+        return data, data.count(b"\n")
+    try:
+        data, count = _story_jsonl(story_path)
+    except Exception:
+        # Not cached, so the story is parsed again on the next run
+        return b"", 0
+    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, cached)
+    return data, count
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Extract IDML story text to JSONL")
     parser.add_argument("idml_dir", help="Path to unpacked IDML directory")
     parser.add_argument("out_jsonl", help="Output JSONL file")
+    add_jobs_argument(parser, "parsing stories")
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse per-story extracts from this directory for unchanged story files",
+    )
     args = parser.parse_args()
 
     root = Path(args.idml_dir)
@@ -51,32 +114,21 @@ def main() -> int:
         raise SystemExit(f"Stories directory not found: {stories_dir}")
 
     out_path = Path(args.out_jsonl)
-    records = []
+    story_paths = xml_files(stories_dir)
+    count = 0
 
-    for story_path in _iter_stories(stories_dir):
-        try:
-            tree = ET.parse(story_path)
-        except Exception:
-            continue
-        story_root = tree.getroot()
-        idx = 0
-        for p_style, c_style, text in _walk_content(story_root):
-            records.append({
-                "id": f"{story_path.name}::{idx}",
-                "story": story_path.name,
-                "index": idx,
-                "paragraph_style": p_style,
-                "character_style": c_style,
-                "text": text,
-            })
-            idx += 1
-
-    with out_path.open("w", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, ensure_ascii=False))
-            f.write("\n")
-
-    print(f"Wrote {len(records)} records to {out_path}")
+    process = _process_story
+    if args.cache_dir:
+        cache_dir = Path(args.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        process = partial(_process_story_cached, cache_dir=cache_dir)
+
+    with out_path.open("wb") as f:
+        for chunk, n in map_paths(process, story_paths, args.jobs):
+            f.write(chunk)
+            count += n
+
+    print(f"Wrote {count} records to {out_path}")
     return 0
 
 
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Helpers shared by the IDML scripts: JSONL I/O, component listing, parallel map."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, List, Sequence, TypeVar
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps(rec: dict) -> bytes:
+    """Serialize one JSONL record (no trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(rec)
+    # Compact separators so the bytes match orjson whether or not it is installed
+    return json.dumps(rec, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_records(path: Path, chunk_size: int = 1 << 20) -> Iterator[dict]:
+    """Yield JSONL records, reading the file in large chunks and splitting on newlines."""
+    tail = b""
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                if line and not line.isspace():
+                    yield loads(line)
+    if tail and not tail.isspace():
+        yield loads(tail)
+
+
+def xml_files(directory: Path) -> List[Path]:
+    """Return directory/*.xml files sorted by name, listed with one scandir pass."""
+    with os.scandir(directory) as it:
+        names = sorted(entry.name for entry in it if entry.name.endswith(".xml") and entry.is_file())
+    return [directory / name for name in names]
+
+
+def map_paths(
+    fn: Callable[[T], R], items: Sequence[T], jobs: int | None, chunksize: int = 4
+) -> Iterator[R]:
+    """Map fn over items in order, across worker processes unless jobs == 1."""
+    if jobs == 1 or len(items) < 2:
+        yield from map(fn, items)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        yield from ex.map(fn, items, chunksize=chunksize)
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser, work: str) -> None:
+    """Add the shared --jobs option; work names what the worker processes do."""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"Worker processes for {work} (default: CPU count; 1 disables)",
+    )
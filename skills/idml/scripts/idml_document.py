@@ -14,6 +14,7 @@ try:
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
+from .idml_common import xml_files
 from .utilities import XMLEditor
 
 
@@ -25,6 +26,7 @@ class IDMLDocument:
         if not self.root.is_dir():
             raise ValueError(f"Not a directory: {self.root}")
         self._editors: dict[str, XMLEditor] = {}
+        self._designmap_srcs: list[str] | None = None
 
     def __getitem__(self, rel_path: str) -> XMLEditor:
         path = self.root / rel_path
@@ -38,47 +40,36 @@ class IDMLDocument:
         return self["designmap.xml"]
 
     def story_paths(self) -> list[Path]:
-        stories_dir = self.root / "Stories"
-        if not stories_dir.is_dir():
-            return []
-        return sorted(stories_dir.glob("*.xml"))
+        return self._xml_paths("Stories")
 
     def spread_paths(self) -> list[Path]:
-        spreads_dir = self.root / "Spreads"
-        if not spreads_dir.is_dir():
-            return []
-        return sorted(spreads_dir.glob("*.xml"))
+        return self._xml_paths("Spreads")
 
     def master_spread_paths(self) -> list[Path]:
-        ms_dir = self.root / "MasterSpreads"
-        if not ms_dir.is_dir():
-            return []
-        return sorted(ms_dir.glob("*.xml"))
+        return self._xml_paths("MasterSpreads")
 
     def resource_paths(self) -> list[Path]:
-        res_dir = self.root / "Resources"
-        if not res_dir.is_dir():
+        return self._xml_paths("Resources")
+
+    def _xml_paths(self, dirname: str) -> list[Path]:
+        directory = self.root / dirname
+        if not directory.is_dir():
             return []
-        return sorted(res_dir.glob("*.xml"))
+        return xml_files(directory)
 
     def referenced_story_paths(self) -> list[str]:
         """Return story file paths referenced from designmap.xml (best-effort)."""
-        dm = self.root / "designmap.xml"
-        if not dm.is_file():
-            return []
-        try:
-            tree = ET.parse(dm)
-        except Exception:
-            return []
-        root = tree.getroot()
-        refs = []
-        for elem in root.iter():
-            for attr_name, value in elem.attrib.items():
-                if attr_name.endswith("src") and value.startswith("Stories/"):
-                    refs.append(value)
-        return sorted(set(refs))
+        return self._designmap_refs("Stories/")
 
     def referenced_spread_paths(self) -> list[str]:
+        return self._designmap_refs("Spreads/")
+
+    def _designmap_refs(self, prefix: str) -> list[str]:
+        if self._designmap_srcs is None:
+            self._designmap_srcs = self._read_designmap_srcs()
+        return sorted({value for value in self._designmap_srcs if value.startswith(prefix)})
+
+    def _read_designmap_srcs(self) -> list[str]:
         dm = self.root / "designmap.xml"
         if not dm.is_file():
             return []
@@ -87,13 +78,17 @@ class IDMLDocument:
         except Exception:
             return []
         root = tree.getroot()
-        refs = []
+        # idPkg:Story/Spread/... elements carry an unqualified src attribute
+        srcs = [elem.attrib["src"] for elem in root.iterfind(".//*[@src]")]
+        if srcs:
+            return srcs
         for elem in root.iter():
             for attr_name, value in elem.attrib.items():
-                if attr_name.endswith("src") and value.startswith("Spreads/"):
-                    refs.append(value)
-        return sorted(set(refs))
+                if attr_name.endswith("src"):
+                    srcs.append(value)
+        return srcs
 
     def save(self) -> None:
         for editor in self._editors.values():
             editor.save()
+        self._designmap_srcs = None
@@ -5,28 +5,33 @@ from __future__ import annotations
 
 import argparse
 import json
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 try:
     from defusedxml import ElementTree as ET
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
+try:
+    from scripts.idml_common import add_jobs_argument, map_paths, xml_files
+except ImportError:  # run directly as scripts/map_story_spreads.py
+    from idml_common import add_jobs_argument, map_paths, xml_files
+
 
-def _strip_ns(tag: str) -> str:
-    return tag.split("}", 1)[-1] if "}" in tag else tag
+def _story_id(story: Path) -> Optional[str]:
+    try:
+        tree = ET.parse(story)
+    except Exception:
+        return None
+    return tree.getroot().attrib.get("Self")
 
 
-def _story_id_map(stories_dir: Path) -> Dict[str, str]:
+def _story_id_map(stories_dir: Path, jobs: int | None = None) -> Dict[str, str]:
     mapping: Dict[str, str] = {}
-    for story in sorted(stories_dir.glob("*.xml")):
-        try:
-            tree = ET.parse(story)
-        except Exception:
-            continue
-        root = tree.getroot()
-        story_id = root.attrib.get("Self")
+    stories = xml_files(stories_dir)
+    for story, story_id in zip(stories, map_paths(_story_id, stories, jobs)):
         if story_id:
             mapping[story_id] = story.name
     return mapping
@@ -34,18 +39,33 @@ def _story_id_map(stories_dir: Path) -> Dict[str, str]:
 
 def _spread_pages(root: ET.Element) -> List[str]:
     pages = []
-    for elem in root.iter():
-        if _strip_ns(elem.tag) == "Page":
-            name = elem.attrib.get("Name")
-            if name:
-                pages.append(name)
+    for elem in root.iterfind(".//{*}Page"):
+        name = elem.attrib.get("Name")
+        if name:
+            pages.append(name)
     return pages
 
 
+def _spread_frames(spread: Path) -> Optional[Tuple[List[str], List[Tuple[str, Optional[str]]]]]:
+    """Return (pages, [(parent_story, frame_id), ...]) for one spread file."""
+    try:
+        tree = ET.parse(spread)
+    except Exception:
+        return None
+    root_el = tree.getroot()
+    frames = []
+    for elem in root_el.iterfind(".//{*}TextFrame"):
+        parent_story = elem.attrib.get("ParentStory")
+        if parent_story:
+            frames.append((parent_story, elem.attrib.get("Self")))
+    return _spread_pages(root_el), frames
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Map stories to spreads/pages")
     parser.add_argument("unpacked_dir", help="Path to unpacked IDML directory")
     parser.add_argument("--out", required=True, help="Output JSON report")
+    add_jobs_argument(parser, "parsing XML files")
     args = parser.parse_args()
 
     root = Path(args.unpacked_dir)
@@ -55,23 +75,15 @@ def main() -> int:
     if not stories_dir.is_dir() or not spreads_dir.is_dir():
         raise SystemExit("Missing Stories/ or Spreads/ directory")
 
-    story_ids = _story_id_map(stories_dir)
+    story_ids = _story_id_map(stories_dir, args.jobs)
     story_map: Dict[str, dict] = {}
 
-    for spread in sorted(spreads_dir.glob("*.xml")):
-        try:
-            tree = ET.parse(spread)
-        except Exception:
+    spreads = xml_files(spreads_dir)
+    for spread, result in zip(spreads, map_paths(_spread_frames, spreads, args.jobs)):
+        if result is None:
             continue
-        root_el = tree.getroot()
-        pages = _spread_pages(root_el)
-
-        for elem in root_el.iter():
-            if _strip_ns(elem.tag) != "TextFrame":
-                continue
-            parent_story = elem.attrib.get("ParentStory")
-            if not parent_story:
-                continue
+        pages, frames = result
+        for parent_story, frame_id in frames:
             story_name = story_ids.get(parent_story, None)
             entry = story_map.setdefault(parent_story, {
                 "story_id": parent_story,
@@ -81,12 +93,12 @@ def main() -> int:
             entry["spreads"].append({
                 "spread": spread.name,
                 "pages": pages,
-                "frame_id": elem.attrib.get("Self"),
+                "frame_id": frame_id,
             })
 
     # Build report
     report = {
-        "stories": sorted(story_map.values(), key=lambda x: x["story_id"]),
+        "stories": sorted(story_map.values(), key=itemgetter("story_id")),
         "unmapped_story_ids": sorted([sid for sid in story_ids if sid not in story_map]),
         "story_id_count": len(story_ids),
         "mapped_story_count": len(story_map),
@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
 import zipfile
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import IO, Dict, Iterator, List, Tuple
 
 try:
     from defusedxml import ElementTree as ET
@@ -21,21 +23,36 @@ except Exception:  # pragma: no cover
 
 
 def _strip_ns(tag: str) -> str:
-    return tag.split("}", 1)[-1] if "}" in tag else tag
+    return sys.intern(tag.split("}", 1)[-1] if "}" in tag else tag)
 
 
-def _iter_xml_paths(path: Path) -> Iterable[Tuple[str, bytes]]:
+def _walk_xml(root: str) -> List[str]:
+    """Return relative paths of *.xml files under root, in sorted path order."""
+    rels = []
+    for dirpath, _, files in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in files:
+            if name.endswith(".xml"):
+                rels.append(name if rel_dir == os.curdir else os.path.join(rel_dir, name))
+    # Component-wise, as sorting Path objects did
+    return sorted(rels, key=lambda rel: rel.split(os.sep))
+
+
+def _iter_xml_paths(path: Path) -> Iterator[Tuple[str, IO[bytes]]]:
+    """Yield (name, binary stream) for each XML file; streams close on advance."""
     if path.is_dir():
-        for xml_path in sorted(path.rglob("*.xml")):
-            rel = str(xml_path.relative_to(path))
-            yield rel, xml_path.read_bytes()
+        root = str(path)
+        for rel in _walk_xml(root):
+            with open(os.path.join(root, rel), "rb") as fp:
+                yield rel, fp
         return
 
     if path.is_file() and path.suffix.lower() == ".idml":
         with zipfile.ZipFile(path) as zf:
             for name in sorted(zf.namelist()):
                 if name.endswith(".xml"):
-                    yield name, zf.read(name)
+                    with zf.open(name) as fp:
+                        yield name, fp
         return
 
     raise ValueError(f"Unsupported path: {path}")
@@ -50,31 +67,72 @@ def _record_attr(bucket: Dict, attr: str, value: str, sample_limit: int) -> None
         entry["samples"].append(value)
 
 
-def _record_element(stats: Dict, elem: ET.Element, sample_limit: int) -> None:
-    tag = _strip_ns(elem.tag)
-    entry = stats.setdefault(
-        tag,
-        {
-            "count": 0,
-            "attributes": {},
-            "children": defaultdict(int),
-            "text_nodes": 0,
-            "tail_nodes": 0,
-        },
-    )
-
-    entry["count"] += 1
-    for attr, value in elem.attrib.items():
-        _record_attr(entry["attributes"], attr, value, sample_limit)
-
-    if elem.text and elem.text.strip():
-        entry["text_nodes"] += 1
-    if elem.tail and elem.tail.strip():
-        entry["tail_nodes"] += 1
-
-    for child in list(elem):
-        entry["children"][_strip_ns(child.tag)] += 1
-        _record_element(stats, child, sample_limit)
+def _record_xml(source: IO[bytes], sample_limit: int) -> Tuple[str, Dict]:
+    """Stream one XML document and return (root tag, element stats).
+
+    Text is counted on each element's end event and tails on its parent's end
+    event; children are dropped once counted so memory stays O(depth).
+    """
+    stats: Dict[str, dict] = {}
+    stack: List[dict] = []
+    root_tag = ""
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            tag = _strip_ns(elem.tag)
+            if not stack:
+                root_tag = tag
+            entry = stats.setdefault(
+                tag,
+                {
+                    "count": 0,
+                    "attributes": {},
+                    "children": defaultdict(int),
+                    "text_nodes": 0,
+                    "tail_nodes": 0,
+                },
+            )
+            entry["count"] += 1
+            for attr, value in elem.attrib.items():
+                _record_attr(entry["attributes"], sys.intern(attr), value, sample_limit)
+            if stack:
+                stack[-1]["children"][tag] += 1
+            stack.append(entry)
+            continue
+
+        entry = stack.pop()
+        if elem.text and elem.text.strip():
+            entry["text_nodes"] += 1
+        for child in elem:
+            if child.tail and child.tail.strip():
+                stats[_strip_ns(child.tag)]["tail_nodes"] += 1
+        del elem[:]
+    return root_tag, stats
+
+
+def _merge_stats(stats: Dict, file_stats: Dict, sample_limit: int) -> None:
+    for tag, src in file_stats.items():
+        entry = stats.get(tag)
+        if entry is None:
+            stats[tag] = src
+            continue
+        entry["count"] += src["count"]
+        entry["text_nodes"] += src["text_nodes"]
+        entry["tail_nodes"] += src["tail_nodes"]
+        for child, count in src["children"].items():
+            entry["children"][child] += count
+        attrs = entry["attributes"]
+        for attr, src_attr in src["attributes"].items():
+            attr_entry = attrs.get(attr)
+            if attr_entry is None:
+                attrs[attr] = src_attr
+                continue
+            attr_entry["count"] += src_attr["count"]
+            samples = attr_entry["samples"]
+            for value in src_attr["samples"]:
+                if len(samples) >= sample_limit:
+                    break
+                if value not in samples:
+                    samples.append(value)
 
 
 def _merge_children(stats: Dict) -> None:
@@ -121,13 +179,13 @@ def main() -> int:
             sources.append(path.name)
         else:
             sources.append(str(path))
-        for name, data in _iter_xml_paths(path):
+        for name, fp in _iter_xml_paths(path):
             try:
-                root = ET.fromstring(data)
+                root_tag, file_stats = _record_xml(fp, args.sample_limit)
             except Exception:
                 continue
-            file_roots[name] = _strip_ns(root.tag)
-            _record_element(element_stats, root, args.sample_limit)
+            file_roots[name] = root_tag
+            _merge_stats(element_stats, file_stats, args.sample_limit)
 
     _merge_children(element_stats)
 
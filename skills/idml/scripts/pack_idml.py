@@ -8,10 +8,14 @@ import os
 import sys
 import zipfile
 
+_BUFFER_SIZE = 1 << 20
 
-def pack_idml(src_dir: str, out_path: str) -> None:
+
+def pack_idml(src_dir: str, out_path: str, compresslevel: int = 1) -> None:
+    """Zip src_dir; compresslevel 0 stores entries, 1-9 selects the deflate level."""
+    compress_type = zipfile.ZIP_DEFLATED if compresslevel > 0 else zipfile.ZIP_STORED
     mimetype_path = os.path.join(src_dir, "mimetype")
-    with zipfile.ZipFile(out_path, "w") as zf:
+    with open(out_path, "wb", buffering=_BUFFER_SIZE) as raw, zipfile.ZipFile(raw, "w") as zf:
         if os.path.isfile(mimetype_path):
             with open(mimetype_path, "rb") as f:
                 zf.writestr("mimetype", f.read(), compress_type=zipfile.ZIP_STORED)
@@ -22,20 +26,28 @@ def pack_idml(src_dir: str, out_path: str) -> None:
                 rel_path = os.path.relpath(full_path, src_dir)
                 if rel_path == "mimetype":
                     continue
-                zf.write(full_path, rel_path, compress_type=zipfile.ZIP_DEFLATED)
+                zf.write(full_path, rel_path, compress_type=compress_type, compresslevel=compresslevel)
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Pack directory into .idml")
     parser.add_argument("src_dir", help="Unpacked IDML directory")
     parser.add_argument("out_idml", help="Output .idml path")
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="{0-9}",
+        help="Deflate level; 0 stores entries uncompressed (default: 1, fastest)",
+    )
     args = parser.parse_args()
 
     if not os.path.isdir(args.src_dir):
         print(f"Directory not found: {args.src_dir}", file=sys.stderr)
         return 1
 
-    pack_idml(args.src_dir, args.out_idml)
+    pack_idml(args.src_dir, args.out_idml, args.compresslevel)
     return 0
 
 
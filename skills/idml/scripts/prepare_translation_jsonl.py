@@ -4,9 +4,15 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+try:
+    from scripts.idml_common import dumps, iter_records
+except ImportError:  # run directly as scripts/prepare_translation_jsonl.py
+    from idml_common import dumps, iter_records
+
+_BUFFER_SIZE = 1 << 20
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Prepare JSONL for translation")
@@ -18,15 +24,11 @@ def main() -> int:
     inp = Path(args.in_jsonl)
     out = Path(args.out_jsonl)
 
-    with inp.open("r", encoding="utf-8") as f_in, out.open("w", encoding="utf-8") as f_out:
-        for line in f_in:
-            line = line.strip()
-            if not line:
-                continue
-            rec = json.loads(line)
+    with out.open("wb", buffering=_BUFFER_SIZE) as f_out:
+        for rec in iter_records(inp):
             if args.field not in rec:
                 rec[args.field] = ""
-            f_out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            f_out.write(dumps(rec) + b"\n")
 
     print(f"Wrote {out}")
     return 0
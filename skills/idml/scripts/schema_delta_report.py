@@ -6,17 +6,15 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, KeysView, List
 
 
 def _load(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def _dict_keys(obj: dict | None) -> set[str]:
-    if not obj:
-        return set()
-    return set(obj.keys())
+def _keys(obj: dict | None) -> KeysView[str]:
+    return (obj or {}).keys()
 
 
 def main() -> int:
@@ -32,8 +30,8 @@ def main() -> int:
     base_elements: Dict[str, dict] = base.get("elements", {})
     new_elements: Dict[str, dict] = new.get("elements", {})
 
-    base_keys = set(base_elements.keys())
-    new_keys = set(new_elements.keys())
+    base_keys = base_elements.keys()
+    new_keys = new_elements.keys()
 
     added_elements = sorted(new_keys - base_keys)
     removed_elements = sorted(base_keys - new_keys)
@@ -47,8 +45,8 @@ def main() -> int:
         base_entry = base_elements.get(element, {})
         new_entry = new_elements.get(element, {})
 
-        base_attrs = _dict_keys(base_entry.get("attributes"))
-        new_attrs = _dict_keys(new_entry.get("attributes"))
+        base_attrs = _keys(base_entry.get("attributes"))
+        new_attrs = _keys(new_entry.get("attributes"))
         attrs_added = sorted(new_attrs - base_attrs)
         attrs_removed = sorted(base_attrs - new_attrs)
         if attrs_added:
@@ -56,8 +54,8 @@ def main() -> int:
         if attrs_removed:
             removed_attrs[element] = attrs_removed
 
-        base_children = _dict_keys(base_entry.get("children"))
-        new_children = _dict_keys(new_entry.get("children"))
+        base_children = _keys(base_entry.get("children"))
+        new_children = _keys(new_entry.get("children"))
         children_added = sorted(new_children - base_children)
         children_removed = sorted(base_children - new_children)
         if children_added:
@@ -4,21 +4,34 @@
 from __future__ import annotations
 
 import argparse
-import runpy
+import importlib
 import sys
 from pathlib import Path
+from typing import Callable
+
+
+def _script_main(script: Path) -> Callable[[], int]:
+    """Import a sibling script once (cached in sys.modules) and return its main()."""
+    # Import as scripts.<name>, the root the scripts themselves try first, so
+    # shared modules such as idml_common are loaded once under one name
+    skill_dir = str(script.parent.parent)
+    if skill_dir not in sys.path:
+        sys.path.insert(0, skill_dir)
+    return importlib.import_module(f"{script.parent.name}.{script.stem}").main
 
 
 def _run_script(script: Path, args: list[str]) -> None:
+    main_fn = _script_main(script)
     old_argv = sys.argv
     try:
         sys.argv = [str(script)] + args
-        runpy.run_path(str(script), run_name="__main__")
+        code = main_fn()
     except SystemExit as exc:
-        if exc.code not in (0, None):
-            raise
+        code = exc.code
     finally:
         sys.argv = old_argv
+    if code not in (0, None):
+        raise SystemExit(code)
 
 
 def main() -> int:
@@ -29,6 +42,7 @@ def main() -> int:
     parser.add_argument("--schema", help="Observed schema JSON file")
     parser.add_argument("--schema-report", help="Write observed schema reports (base path or .json)")
     parser.add_argument("--schema-strict", action="store_true", help="Fail if schema validation reports issues")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print unpacked XML (slower; for inspection)")
     args = parser.parse_args()
 
     idml_file = Path(args.idml_file)
@@ -40,7 +54,10 @@ def main() -> int:
 
     scripts_dir = Path(__file__).resolve().parent
 
-    _run_script(scripts_dir / "unpack_idml.py", [str(idml_file), str(unpack_dir)])
+    unpack_args = [str(idml_file), str(unpack_dir)]
+    if not args.pretty:
+        unpack_args.append("--no-pretty")
+    _run_script(scripts_dir / "unpack_idml.py", unpack_args)
     _run_script(scripts_dir / "validate_idml.py", [str(unpack_dir), "--original", str(idml_file)])
     if args.schema:
         schema_reports = _schema_report_paths(args.schema_report, work_dir)
@@ -48,7 +65,8 @@ def main() -> int:
             scripts_dir / "validate_observed_schema.py",
             _schema_args(args.schema, idml_file, schema_reports[0], args.schema_strict),
         )
-    _run_script(scripts_dir / "pack_idml.py", [str(unpack_dir), str(out_file)])
+    # Roundtrip output is only validated, so skip compression
+    _run_script(scripts_dir / "pack_idml.py", [str(unpack_dir), str(out_file), "--compresslevel", "0"])
     _run_script(scripts_dir / "validate_idml.py", [str(unpack_dir), "--original", str(out_file)])
     if args.schema:
         schema_reports = _schema_report_paths(args.schema_report, work_dir)
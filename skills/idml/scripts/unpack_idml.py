@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import os
+import shutil
 import sys
 import zipfile
 from pathlib import Path
@@ -14,6 +15,18 @@ try:
 except Exception:  # pragma: no cover
     from xml.dom import minidom
 
+try:
+    from lxml import etree as LET
+except Exception:  # pragma: no cover
+    LET = None
+
+try:
+    from scripts.idml_common import add_jobs_argument, map_paths
+except ImportError:  # run directly as scripts/unpack_idml.py
+    from idml_common import add_jobs_argument, map_paths
+
+_BUFFER_SIZE = 1 << 20
+
 
 def _is_safe_path(base_dir: str, target_path: str) -> bool:
     base = os.path.abspath(base_dir)
@@ -22,32 +35,70 @@ def _is_safe_path(base_dir: str, target_path: str) -> bool:
 
 
 def safe_extract(zip_path: str, out_dir: str) -> None:
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        for member in zf.infolist():
+    with open(zip_path, "rb", buffering=_BUFFER_SIZE) as raw, zipfile.ZipFile(raw, "r") as zf:
+        members = zf.infolist()
+        for member in members:
             member_path = os.path.join(out_dir, member.filename)
             if not _is_safe_path(out_dir, member_path):
                 raise ValueError(f"Unsafe path in zip: {member.filename}")
-        zf.extractall(out_dir)
+        for member in members:
+            member_path = os.path.join(out_dir, member.filename)
+            if member.is_dir():
+                os.makedirs(member_path, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(member_path), exist_ok=True)
+            with zf.open(member) as src, open(member_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, _BUFFER_SIZE)
+
+
+def _pretty_print_xml_file(xml_file: Path) -> None:
+    if LET is not None:
+        # resolve_entities/no_network keep lxml as safe here as defusedxml
+        parser = LET.XMLParser(resolve_entities=False, no_network=True)
+        try:
+            tree = LET.parse(str(xml_file), parser)
+        except LET.Error:
+            # Large stories can trip libxml2's limits; minidom below has none
+            pass
+        else:
+            tree.write(
+                str(xml_file),
+                encoding="utf-8",
+                xml_declaration=True,
+                standalone=True if tree.docinfo.standalone else None,
+                pretty_print=True,
+            )
+            return
+
+    # ElementTree would drop the <?aid?> PI and rename idPkg: prefixes, so the
+    # stdlib fallback stays on minidom; expat decodes the raw bytes itself.
+    content = xml_file.read_bytes()
+    if not content.strip():
+        return
+    try:
+        dom = minidom.parseString(content)
+    except Exception as exc:
+        print(f"Not pretty-printing {xml_file}: {exc}", file=sys.stderr)
+        return
+    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
 
 
-def _pretty_print_xml_files(out_dir: str) -> None:
+def _pretty_print_xml_files(out_dir: str, jobs: int | None = None) -> None:
     base = Path(out_dir)
     xml_files = list(base.rglob("*.xml"))
-    for xml_file in xml_files:
-        content = xml_file.read_text(encoding="utf-8", errors="ignore")
-        if not content.strip():
-            continue
-        try:
-            dom = minidom.parseString(content)
-        except Exception:
-            continue
-        xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
+    list(map_paths(_pretty_print_xml_file, xml_files, jobs, chunksize=8))
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Unpack IDML into a directory")
     parser.add_argument("idml_file", help="Path to .idml file")
     parser.add_argument("out_dir", help="Output directory")
+    add_jobs_argument(parser, "pretty-printing XML")
+    parser.add_argument(
+        "--no-pretty",
+        action="store_true",
+        help="Leave extracted XML byte-for-byte as stored (faster; skips pretty-printing)",
+    )
     args = parser.parse_args()
 
     if not os.path.isfile(args.idml_file):
@@ -56,7 +107,8 @@ def main() -> int:
 
     os.makedirs(args.out_dir, exist_ok=True)
     safe_extract(args.idml_file, args.out_dir)
-    _pretty_print_xml_files(args.out_dir)
+    if not args.no_pretty:
+        _pretty_print_xml_files(args.out_dir, args.jobs)
     return 0
 
 
@@ -10,12 +10,17 @@ annotated with its original line and column position during parsing.
 from __future__ import annotations
 
 import html
+import os
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
 
+_BUFFER_SIZE = 1 << 20
+
 
 class XMLEditor:
     """
@@ -31,8 +36,12 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
-        parser = _create_line_tracking_parser()
+        # {tagName: {line: [elements]}}, filled while parsing for line lookups
+        self._line_index: dict[str, dict[int, list]] = {}
+        parser = _create_line_tracking_parser(self._line_index)
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._ns_decl: Optional[str] = None
+        self._ns_decl_root = None
 
     def get_node(
         self,
@@ -42,17 +51,15 @@ class XMLEditor:
         contains: Optional[str] = None,
     ):
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
+        normalized_contains = _unescape(contains) if contains is not None else None
+        # id(element) -> subtree text for this call only; callers may mutate the
+        # returned minidom nodes directly, so nothing is kept between calls
+        text_cache: dict[int, str] = {}
+        if line_number is not None:
+            candidates = self._elements_at(tag, line_number)
+        else:
+            candidates = self.dom.getElementsByTagName(tag)
+        for elem in candidates:
             if attrs is not None:
                 if not all(
                     elem.getAttribute(attr_name) == attr_value
@@ -60,10 +67,8 @@ class XMLEditor:
                 ):
                     continue
 
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
+            if normalized_contains is not None:
+                if normalized_contains not in self._get_element_text(elem, text_cache):
                     continue
 
             matches.append(elem)
@@ -138,30 +143,88 @@ class XMLEditor:
         parent.removeChild(elem)
 
     def save(self):
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        # Stream to a sibling temp file (same encoder settings as toxml) rather
+        # than building the whole document in memory, then swap it into place.
+        # The temp file takes the story's mode and never outlives a failed save.
+        tmp_path = self.xml_path.with_name(self.xml_path.name + ".tmp")
+        try:
+            with open(
+                tmp_path,
+                "w",
+                encoding=self.encoding,
+                errors="xmlcharrefreplace",
+                newline="\n",
+                buffering=_BUFFER_SIZE,
+            ) as f:
+                self.dom.writexml(f, encoding=self.encoding)
+            shutil.copymode(self.xml_path, tmp_path)
+            os.replace(tmp_path, self.xml_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _elements_at(self, tag, line_number):
+        if tag == "*":
+            # Wildcard spans every tag's buckets; merge them back into document order
+            elements = []
+            for by_line in self._line_index.values():
+                elements.extend(self._elements_in(by_line, line_number))
+            elements.sort(key=lambda elem: elem.parse_position)
+            return elements
+        return self._elements_in(self._line_index.get(tag, {}), line_number)
+
+    def _elements_in(self, by_line, line_number):
+        if isinstance(line_number, range):
+            lines = sorted(line for line in by_line if line in line_number)
+        else:
+            lines = [line_number]
+        elements = []
+        for line in lines:
+            elements.extend(elem for elem in by_line.get(line, ()) if self._is_attached(elem))
+        return elements
 
-    def _get_element_text(self, elem):
+    def _is_attached(self, elem):
+        # Indexed elements may since have been removed or replaced
+        node = elem
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
+    def _get_element_text(self, elem, cache=None):
+        if cache is not None:
+            cached = cache.get(id(elem))
+            if cached is not None:
+                return cached
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
                 if node.data.strip():
                     text_parts.append(node.data)
             else:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+                text_parts.append(self._get_element_text(node, cache))
+        text = "".join(text_parts)
+        if cache is not None:
+            cache[id(elem)] = text
+        return text
 
-    def _parse_fragment(self, xml_content):
+    def _namespace_decl(self):
         root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        # Recomputed only if the document element itself was replaced
+        if self._ns_decl is None or self._ns_decl_root is not root_elem:
+            namespaces = []
+            if root_elem and root_elem.attributes:
+                for i in range(root_elem.attributes.length):
+                    attr = root_elem.attributes.item(i)
+                    if attr.name.startswith("xmlns"):  # type: ignore
+                        namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._ns_decl = " ".join(namespaces)
+            self._ns_decl_root = root_elem
+        return self._ns_decl
+
+    def _parse_fragment(self, xml_content):
+        wrapper = f"<root {self._namespace_decl()}>{xml_content}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
         nodes = [
             self.dom.importNode(child, deep=True)
@@ -172,7 +235,12 @@ class XMLEditor:
         return nodes
 
 
-def _create_line_tracking_parser():
+@lru_cache(maxsize=1024)
+def _unescape(text: str) -> str:
+    return html.unescape(text)
+
+
+def _create_line_tracking_parser(line_index=None):
     def set_content_handler(dom_handler):
         def startElementNS(name, tagName, attrs):
             orig_start_cb(name, tagName, attrs)
@@ -181,6 +249,9 @@ def _create_line_tracking_parser():
                 parser._parser.CurrentLineNumber,  # type: ignore
                 parser._parser.CurrentColumnNumber,  # type: ignore
             )
+            if line_index is not None:
+                by_line = line_index.setdefault(cur_elem.tagName, {})
+                by_line.setdefault(cur_elem.parse_position[0], []).append(cur_elem)
 
         orig_start_cb = dom_handler.startElementNS
         dom_handler.startElementNS = startElementNS
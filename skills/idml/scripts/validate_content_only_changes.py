@@ -4,73 +4,104 @@
 from __future__ import annotations
 
 import argparse
+import filecmp
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 try:
     from defusedxml import ElementTree as ET
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
+try:
+    from scripts.idml_common import add_jobs_argument, map_paths
+except ImportError:  # run directly as scripts/validate_content_only_changes.py
+    from idml_common import add_jobs_argument, map_paths
+
 
 def _strip_ns(tag: str) -> str:
     return tag.split("}", 1)[-1] if "}" in tag else tag
 
 
-def _compare_elements(a: ET.Element, b: ET.Element, errors: List[str], path: str) -> None:
-    if a.tag != b.tag:
-        errors.append(f"{path}: tag mismatch {a.tag!r} vs {b.tag!r}")
-        return
+def _compare_elements(a_root: ET.Element, b_root: ET.Element, errors: List[str], root_path: str) -> None:
+    """Walk both trees depth-first in document order, clearing each pair once checked."""
+    stack = [(a_root, b_root, root_path)]
+    while stack:
+        a, b, path = stack.pop()
+        if a.tag != b.tag:
+            errors.append(f"{path}: tag mismatch {a.tag!r} vs {b.tag!r}")
+            continue
 
-    tag_name = _strip_ns(a.tag)
+        tag_name = _strip_ns(a.tag)
 
-    if tag_name == "Content":
-        if a.attrib != b.attrib:
-            errors.append(f"{path}: Content attributes changed")
-        if list(a) or list(b):
-            errors.append(f"{path}: Content has child elements")
-        if a.tail != b.tail:
-            errors.append(f"{path}: Content tail changed")
-        return
+        if tag_name == "Content":
+            if a.attrib != b.attrib:
+                errors.append(f"{path}: Content attributes changed")
+            if len(a) or len(b):
+                errors.append(f"{path}: Content has child elements")
+            if a.tail != b.tail:
+                errors.append(f"{path}: Content tail changed")
+            continue
 
-    if a.attrib != b.attrib:
-        errors.append(f"{path}: attributes changed")
-        return
+        if a.attrib != b.attrib:
+            errors.append(f"{path}: attributes changed")
+            continue
 
-    if a.text != b.text:
-        errors.append(f"{path}: text changed in non-Content element")
-        return
+        if a.text != b.text:
+            errors.append(f"{path}: text changed in non-Content element")
+            continue
 
-    if a.tail != b.tail:
-        errors.append(f"{path}: tail changed in non-Content element")
-        return
+        if a.tail != b.tail:
+            errors.append(f"{path}: tail changed in non-Content element")
+            continue
 
-    a_children = list(a)
-    b_children = list(b)
-    if len(a_children) != len(b_children):
-        errors.append(f"{path}: child count changed ({len(a_children)} vs {len(b_children)})")
-        return
+        a_children = list(a)
+        b_children = list(b)
+        if len(a_children) != len(b_children):
+            errors.append(f"{path}: child count changed ({len(a_children)} vs {len(b_children)})")
+            continue
 
-    for idx, (a_child, b_child) in enumerate(zip(a_children, b_children)):
-        child_path = f"{path}/{_strip_ns(a_child.tag)}[{idx}]"
-        _compare_elements(a_child, b_child, errors, child_path)
+        # Reversed so children pop in document order, matching the old recursion
+        for idx in range(len(a_children) - 1, -1, -1):
+            a_child = a_children[idx]
+            stack.append((a_child, b_children[idx], f"{path}/{_strip_ns(a_child.tag)}[{idx}]"))
+        # Children now live on the stack; release the checked parents
+        a.clear()
+        b.clear()
 
 
-def _compare_story_file(original: Path, modified: Path, errors: List[str]) -> None:
+def _compare_story_file(pair: Tuple[Path, Path]) -> List[str]:
+    original, modified = pair
+    errors: List[str] = []
     try:
         a_tree = ET.parse(original)
         b_tree = ET.parse(modified)
     except Exception as exc:
         errors.append(f"{original.name}: failed to parse XML ({exc})")
-        return
+        return errors
 
     a_root = a_tree.getroot()
     b_root = b_tree.getroot()
     _compare_elements(a_root, b_root, errors, f"{original.name}/{_strip_ns(a_root.tag)}")
-
-
-def _list_files(root: Path) -> List[Path]:
-    return sorted([p.relative_to(root) for p in root.rglob("*") if p.is_file()])
+    return errors
+
+
+def _list_files(root: Path) -> List[str]:
+    """Return '/'-separated relative paths of all files under root."""
+    files: List[str] = []
+    stack = [("", str(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                rel_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((rel_path + "/", entry.path))
+                elif entry.is_file():
+                    files.append(rel_path)
+    # Same order as sorting Path objects (component-wise)
+    return sorted(files, key=lambda rel_path: rel_path.split("/"))
 
 
 def main() -> int:
@@ -79,6 +110,7 @@ def main() -> int:
     )
     parser.add_argument("original_dir", help="Original unpacked IDML directory")
     parser.add_argument("modified_dir", help="Modified unpacked IDML directory")
+    add_jobs_argument(parser, "comparing story files")
     args = parser.parse_args()
 
     original_root = Path(args.original_dir)
@@ -92,24 +124,42 @@ def main() -> int:
 
     errors: List[str] = []
 
-    if set(original_files) != set(modified_files):
-        missing = sorted(set(original_files) - set(modified_files))
-        extra = sorted(set(modified_files) - set(original_files))
+    original_set = set(original_files)
+    modified_set = set(modified_files)
+    if original_set != modified_set:
+        missing = [rel_path for rel_path in original_files if rel_path not in modified_set]
+        extra = [rel_path for rel_path in modified_files if rel_path not in original_set]
         if missing:
             errors.append(f"Missing files in modified: {missing}")
         if extra:
             errors.append(f"Extra files in modified: {extra}")
         # Continue to report other differences where possible
 
-    for rel_path in sorted(set(original_files).intersection(set(modified_files))):
+    shared = [rel_path for rel_path in original_files if rel_path in modified_set]
+    story_rels = [
+        rel_path for rel_path in shared if rel_path.startswith("Stories/") and rel_path.endswith(".xml")
+    ]
+    story_errors = dict(
+        zip(
+            story_rels,
+            map_paths(
+                _compare_story_file,
+                [(original_root / rel_path, modified_root / rel_path) for rel_path in story_rels],
+                args.jobs,
+            ),
+        )
+    )
+
+    for rel_path in shared:
         orig = original_root / rel_path
         mod = modified_root / rel_path
 
-        if rel_path.parts and rel_path.parts[0] == "Stories" and rel_path.suffix == ".xml":
-            _compare_story_file(orig, mod, errors)
+        if rel_path in story_errors:
+            errors.extend(story_errors[rel_path])
             continue
 
-        if orig.read_bytes() != mod.read_bytes():
+        # Size check first, then a chunked byte compare
+        if not filecmp.cmp(orig, mod, shallow=False):
             errors.append(f"{rel_path}: file changed outside Stories")
 
     if errors:
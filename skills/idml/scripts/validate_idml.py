@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import sys
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -22,7 +23,18 @@ def _read_text(path: Path) -> str:
 
 def _container_rootfile(container_path: Path) -> str | None:
     try:
-        tree = ET.parse(container_path)
+        stat = container_path.stat()
+    except OSError:
+        return None
+    return _parsed_rootfile(str(container_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parsed_rootfile(path: str, mtime_ns: int, size: int) -> str | None:
+    # Keyed on mtime/size so repeated validations in one process (smoke_test
+    # checks the same unpacked dir twice) reuse the parse until the file changes
+    try:
+        tree = ET.parse(path)
     except Exception:
         return None
     root = tree.getroot()
@@ -66,12 +78,17 @@ def validate(unpacked_dir: Path, original_file: Path | None, verbose: bool = Fal
         if not (unpacked_dir / dirname).is_dir():
             warnings.append(f"Missing {dirname}/ directory")
 
+    # Already failing; don't pay for reading the original's central directory
+    if errors:
+        _print_results(errors, warnings, verbose)
+        return 1
+
     # If original is provided, verify mimetype placement and compression
     if original_file and original_file.is_file():
         with zipfile.ZipFile(original_file, "r") as zf:
-            names = [i.filename for i in zf.infolist()]
-            if "mimetype" in names:
-                first = zf.infolist()[0]
+            infos = zf.infolist()
+            if any(info.filename == "mimetype" for info in infos):
+                first = infos[0]
                 if first.filename != "mimetype":
                     errors.append("mimetype must be the first ZIP entry")
                 if first.compress_type != zipfile.ZIP_STORED:
@@ -4,80 +4,147 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import zipfile
 from collections import defaultdict
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import IO, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 try:
     from defusedxml import ElementTree as ET
 except Exception:  # pragma: no cover
     import xml.etree.ElementTree as ET
 
+try:
+    from scripts.idml_common import add_jobs_argument, map_paths
+except ImportError:  # run directly as scripts/validate_observed_schema.py
+    from idml_common import add_jobs_argument, map_paths
+
+_READ_BUFFER_SIZE = 128 * 1024
+_BATCH_SIZE = 8
+_ISSUE_KEYS = ("unknown_elements", "unknown_attributes", "unknown_children")
+
 
 def _strip_ns(tag: str) -> str:
     return tag.split("}", 1)[-1] if "}" in tag else tag
 
 
-def _iter_xml_paths(path: Path) -> Iterable[Tuple[str, bytes]]:
+def _list_xml_names(path: Path) -> List[str]:
     if path.is_dir():
-        for xml_path in sorted(path.rglob("*.xml")):
-            rel = str(xml_path.relative_to(path))
-            yield rel, xml_path.read_bytes()
-        return
+        return [str(xml_path.relative_to(path)) for xml_path in sorted(path.rglob("*.xml"))]
 
     if path.is_file() and path.suffix.lower() == ".idml":
         with zipfile.ZipFile(path) as zf:
-            for name in sorted(zf.namelist()):
-                if name.endswith(".xml"):
-                    yield name, zf.read(name)
-        return
+            return [name for name in sorted(zf.namelist()) if name.endswith(".xml")]
 
     raise ValueError(f"Unsupported path: {path}")
 
 
-def _load_schema(path: Path) -> Dict[str, dict]:
+def _iter_xml_streams(path: Path, names: List[str]) -> Iterator[Tuple[str, IO[bytes]]]:
+    """Yield (name, binary stream) for the given XML files; streams close on advance."""
+    if path.is_dir():
+        for name in names:
+            with (path / name).open("rb") as fp:
+                yield name, fp
+        return
+
+    with zipfile.ZipFile(path) as zf:
+        for name in names:
+            # Decompress in 128 KiB steps instead of materializing the member
+            with zf.open(name) as fp:
+                yield name, io.BufferedReader(fp, buffer_size=_READ_BUFFER_SIZE)
+
+
+_SchemaIndex = Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]]
+_UNKNOWN_ENTRY: Tuple[FrozenSet[str], FrozenSet[str]] = (frozenset(), frozenset())
+
+
+def _load_schema(path: Path) -> _SchemaIndex:
+    """Return {tag: (allowed attributes, allowed children)} for each observed element."""
     data = json.loads(path.read_text(encoding="utf-8"))
     elements = data.get("elements", {})
-    return elements
+    return {
+        tag: (
+            frozenset(entry.get("attributes") or ()),
+            frozenset(entry.get("children") or ()),
+        )
+        for tag, entry in elements.items()
+        if entry
+    }
 
 
 def _collect_issues(
-    schema: Dict[str, dict],
-    elem: ET.Element,
+    schema: _SchemaIndex,
+    source: IO[bytes],
     issues: Dict[str, List[dict]],
     file_name: str,
-    path: str,
 ) -> None:
-    tag = _strip_ns(elem.tag)
-    schema_entry = schema.get(tag)
-    if not schema_entry:
-        issues["unknown_elements"].append({"file": file_name, "path": path, "tag": tag})
-        schema_entry = {"attributes": {}, "children": {}}
-
-    allowed_attrs = set(schema_entry.get("attributes", {}).keys())
-    for attr in elem.attrib.keys():
-        if attr not in allowed_attrs:
-            issues["unknown_attributes"].append(
-                {"file": file_name, "path": path, "tag": tag, "attr": attr}
-            )
-
-    allowed_children = set(schema_entry.get("children", {}).keys())
-    for idx, child in enumerate(list(elem)):
-        child_tag = _strip_ns(child.tag)
-        if child_tag not in allowed_children:
-            issues["unknown_children"].append(
-                {
-                    "file": file_name,
-                    "path": path,
-                    "tag": tag,
-                    "child_tag": child_tag,
-                    "index": idx,
-                }
-            )
-        child_path = f"{path}/{child_tag}[{idx}]"
-        _collect_issues(schema, child, issues, file_name, child_path)
+    """Stream one XML document, appending issues in document order.
+
+    Each open element keeps (path, tag, allowed children, next child index) on a
+    stack, and its children are dropped on its end event so memory stays O(depth).
+    """
+    stack: List[Tuple[str, str, FrozenSet[str], List[int]]] = []
+    local_names: Dict[str, str] = {}
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "end":
+            stack.pop()
+            del elem[:]
+            continue
+
+        tag = local_names.get(elem.tag)
+        if tag is None:
+            tag = local_names[elem.tag] = _strip_ns(elem.tag)
+        if stack:
+            parent_path, parent_tag, parent_children, counter = stack[-1]
+            idx = counter[0]
+            counter[0] += 1
+            if tag not in parent_children:
+                issues["unknown_children"].append(
+                    {
+                        "file": file_name,
+                        "path": parent_path,
+                        "tag": parent_tag,
+                        "child_tag": tag,
+                        "index": idx,
+                    }
+                )
+            path = f"{parent_path}/{tag}[{idx}]"
+        else:
+            path = f"{file_name}/{tag}"
+
+        schema_entry = schema.get(tag)
+        if schema_entry is None:
+            issues["unknown_elements"].append({"file": file_name, "path": path, "tag": tag})
+            schema_entry = _UNKNOWN_ENTRY
+        allowed_attrs, allowed_children = schema_entry
+
+        for attr in elem.attrib:
+            if attr not in allowed_attrs:
+                issues["unknown_attributes"].append(
+                    {"file": file_name, "path": path, "tag": tag, "attr": attr}
+                )
+
+        stack.append((path, tag, allowed_children, [0]))
+
+
+def _validate_batch(
+    schema: _SchemaIndex, batch: Tuple[str, List[str]]
+) -> List[Optional[Dict[str, List[dict]]]]:
+    """Return per-file issues for one batch of files (None for a parse error)."""
+    source, names = batch
+    results: List[Optional[Dict[str, List[dict]]]] = []
+    for name, fp in _iter_xml_streams(Path(source), names):
+        # Collected per file so a parse error discards partial results
+        file_issues: Optional[Dict[str, List[dict]]] = {key: [] for key in _ISSUE_KEYS}
+        try:
+            _collect_issues(schema, fp, file_issues, name)
+        except Exception:
+            file_issues = None
+        results.append(file_issues)
+    return results
 
 
 def main() -> int:
@@ -92,28 +159,31 @@ def main() -> int:
         action="store_true",
         help="Exit with status 1 if any issues are found",
     )
+    add_jobs_argument(parser, "validating XML files")
     args = parser.parse_args()
 
     schema = _load_schema(Path(args.schema))
 
-    issues: Dict[str, List[dict]] = {
-        "unknown_elements": [],
-        "unknown_attributes": [],
-        "unknown_children": [],
-    }
+    issues: Dict[str, List[dict]] = {key: [] for key in _ISSUE_KEYS}
 
+    batches: List[Tuple[str, List[str]]] = []
     for raw_path in args.paths:
         path = Path(raw_path)
-        for name, data in _iter_xml_paths(path):
-            try:
-                root = ET.fromstring(data)
-            except Exception:
+        names = _list_xml_names(path)
+        for start in range(0, len(names), _BATCH_SIZE):
+            batches.append((str(path), names[start : start + _BATCH_SIZE]))
+
+    # Each batch already holds _BATCH_SIZE files, so hand them out one at a time
+    validate = partial(_validate_batch, schema)
+    for (_, names), results in zip(batches, map_paths(validate, batches, args.jobs, chunksize=1)):
+        for name, file_issues in zip(names, results):
+            if file_issues is None:
                 issues["unknown_elements"].append(
                     {"file": name, "path": name, "tag": "<parse_error>"}
                 )
                 continue
-            root_tag = _strip_ns(root.tag)
-            _collect_issues(schema, root, issues, name, f"{name}/{root_tag}")
+            for key, found in file_issues.items():
+                issues[key].extend(found)
 
     summary = {
         "unknown_elements": len(issues["unknown_elements"]),
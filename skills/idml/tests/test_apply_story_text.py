@@ -0,0 +1,81 @@
+"""Tests for apply_story_text's story rewriting."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+
+
+def _load(module_name: str, file_name: str):
+    # Loaded by path: the ODT skill also has a top-level ``scripts`` package
+    spec = importlib.util.spec_from_file_location(module_name, _SCRIPTS / file_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# apply_story_text falls back to ``import idml_common`` outside the package
+_load("idml_common", "idml_common.py")
+apply_story_text = _load("idml_apply_story_text", "apply_story_text.py")
+
+_STORY = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Story Self="{self_id}">
+  <ParagraphStyleRange><CharacterStyleRange><Content>Hello</Content></CharacterStyleRange></ParagraphStyleRange>
+</Story>
+"""
+
+
+class ApplyStoryTextTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        stories = self.root / "Stories"
+        stories.mkdir()
+        self.changed = stories / "Story_a.xml"
+        self.untouched = stories / "Story_b.xml"
+        self.changed.write_text(_STORY.format(self_id="a"), encoding="utf-8")
+        self.untouched.write_text(_STORY.format(self_id="b"), encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _apply(self, records):
+        jsonl = self.root / "translations.jsonl"
+        jsonl.write_text("".join(json.dumps(rec) + "\n" for rec in records), encoding="utf-8")
+        argv = ["apply_story_text.py", str(self.root), str(jsonl)]
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(out):
+            self.assertEqual(apply_story_text.main(), 0)
+        return out.getvalue()
+
+    def test_only_stories_with_matched_content_are_rewritten(self):
+        before = self.untouched.read_bytes()
+        before_mtime = self.untouched.stat().st_mtime_ns
+
+        output = self._apply(
+            [
+                {"story": "Story_a.xml", "index": 0, "translation": "Bonjour"},
+                # Mapped, but no Content node has this index
+                {"story": "Story_b.xml", "index": 5, "translation": "Salut"},
+            ]
+        )
+
+        self.assertEqual(output, "Updated 1 content nodes\n")
+        self.assertIn(b"<Content>Bonjour</Content>", self.changed.read_bytes())
+        # Left as-is rather than reserialized: same bytes, same mtime
+        self.assertEqual(self.untouched.read_bytes(), before)
+        self.assertEqual(self.untouched.stat().st_mtime_ns, before_mtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
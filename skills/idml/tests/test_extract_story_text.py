@@ -0,0 +1,71 @@
+"""Tests for extract_story_text's streaming Content walk."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+
+
+def _load(module_name: str, file_name: str):
+    # Loaded by path: the ODT skill also has a top-level ``scripts`` package
+    spec = importlib.util.spec_from_file_location(module_name, _SCRIPTS / file_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# extract_story_text falls back to ``import idml_common`` outside the package
+_load("idml_common", "idml_common.py")
+extract_story_text = _load("idml_extract_story_text", "extract_story_text.py")
+
+_STORY = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<idPkg:Story xmlns:idPkg="http://ns.adobe.com/AdobeInDesign/idml/1.0/packaging" DOMVersion="8.0">
+<Story Self="u10">
+<ParagraphStyleRange AppliedParagraphStyle="ParagraphStyle/Body">
+<CharacterStyleRange AppliedCharacterStyle="CharacterStyle/Plain"><Content>plain</Content></CharacterStyleRange>
+<CharacterStyleRange AppliedCharacterStyle="CharacterStyle/Bold"><Content>bold</Content>
+<Footnote><ParagraphStyleRange AppliedParagraphStyle="ParagraphStyle/Note"><CharacterStyleRange><Content>note inherits bold</Content></CharacterStyleRange>
+<CharacterStyleRange AppliedCharacterStyle="CharacterStyle/Italic"><Content>note italic</Content></CharacterStyleRange></ParagraphStyleRange></Footnote>
+<Content>bold again</Content></CharacterStyleRange>
+<XMLElement MarkupTag="XMLTag/span"><CharacterStyleRange><Content>tagged</Content></CharacterStyleRange></XMLElement>
+</ParagraphStyleRange>
+<ParagraphStyleRange><CharacterStyleRange><Content>unstyled</Content><Content/></CharacterStyleRange></ParagraphStyleRange>
+</Story>
+</idPkg:Story>
+"""
+
+
+class WalkContentTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.story = Path(self._tmp.name) / "Story_u10.xml"
+        self.story.write_text(_STORY, encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_nested_styles_match_recursive_walk(self):
+        # Expected values are what the earlier recursive full-tree walk produced
+        self.assertEqual(
+            list(extract_story_text._walk_content(self.story)),
+            [
+                ("ParagraphStyle/Body", "CharacterStyle/Plain", "plain"),
+                ("ParagraphStyle/Body", "CharacterStyle/Bold", "bold"),
+                ("ParagraphStyle/Note", "CharacterStyle/Bold", "note inherits bold"),
+                ("ParagraphStyle/Note", "CharacterStyle/Italic", "note italic"),
+                ("ParagraphStyle/Body", "CharacterStyle/Bold", "bold again"),
+                ("ParagraphStyle/Body", "", "tagged"),
+                ("", "", "unstyled"),
+                ("", "", ""),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
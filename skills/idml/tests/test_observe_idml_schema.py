@@ -0,0 +1,81 @@
+"""Tests for observe_idml_schema's streaming element statistics."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Loaded by path: the ODT skill also has a top-level ``scripts`` package
+_spec = importlib.util.spec_from_file_location(
+    "idml_observe_idml_schema",
+    Path(__file__).resolve().parents[1] / "scripts" / "observe_idml_schema.py",
+)
+observe_idml_schema = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = observe_idml_schema
+_spec.loader.exec_module(observe_idml_schema)
+
+_STORY_A = b"""<?xml version="1.0"?>
+<idPkg:Story xmlns:idPkg="http://ns.adobe.com/AdobeInDesign/idml/1.0/packaging"><Story Self="u1">
+<ParagraphStyleRange AppliedParagraphStyle="P/Body"><CharacterStyleRange AppliedCharacterStyle="C/A"><Content>one</Content>tail<Br/></CharacterStyleRange></ParagraphStyleRange>
+<ParagraphStyleRange AppliedParagraphStyle="P/Head"><CharacterStyleRange AppliedCharacterStyle="C/B"><Content>two</Content></CharacterStyleRange></ParagraphStyleRange>
+</Story></idPkg:Story>"""
+
+_STORY_B = b"""<?xml version="1.0"?>
+<Story Self="u2"><ParagraphStyleRange AppliedParagraphStyle="P/Note"><Content>three</Content> <Br/>after</ParagraphStyleRange>
+<ParagraphStyleRange AppliedParagraphStyle="P/Body"/></Story>"""
+
+
+def _attr(count, samples):
+    return {"count": count, "samples": samples}
+
+
+def _entry(count, attributes, children, text_nodes, tail_nodes):
+    return {
+        "count": count,
+        "attributes": attributes,
+        "children": children,
+        "text_nodes": text_nodes,
+        "tail_nodes": tail_nodes,
+    }
+
+
+# What the earlier recursive _record_element walk reported for both stories
+# with sample_limit=2, in the same key order
+_EXPECTED = {
+    "Story": _entry(3, {"Self": _attr(2, ["u1", "u2"])}, {"Story": 1, "ParagraphStyleRange": 4}, 0, 0),
+    "ParagraphStyleRange": _entry(
+        4,
+        {"AppliedParagraphStyle": _attr(4, ["P/Body", "P/Head"])},
+        {"CharacterStyleRange": 2, "Content": 1, "Br": 1},
+        0,
+        0,
+    ),
+    "CharacterStyleRange": _entry(
+        2, {"AppliedCharacterStyle": _attr(2, ["C/A", "C/B"])}, {"Content": 2, "Br": 1}, 0, 0
+    ),
+    "Content": _entry(3, {}, {}, 3, 1),
+    "Br": _entry(2, {}, {}, 0, 1),
+}
+
+
+class RecordXmlTest(unittest.TestCase):
+    def test_merged_stats_match_recursive_walk(self):
+        stats = {}
+        roots = []
+        for data in (_STORY_A, _STORY_B):
+            root_tag, file_stats = observe_idml_schema._record_xml(io.BytesIO(data), 2)
+            roots.append(root_tag)
+            observe_idml_schema._merge_stats(stats, file_stats, 2)
+        observe_idml_schema._merge_children(stats)
+
+        self.assertEqual(roots, ["Story", "Story"])
+        # Compared as JSON so key order, and therefore the report bytes, match too
+        self.assertEqual(json.dumps(stats), json.dumps(_EXPECTED))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests for the IDML XMLEditor."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Load by path under a unique name: the ODT skill also has a top-level
+# ``scripts`` package, so ``scripts.utilities`` would collide in one run.
+_spec = importlib.util.spec_from_file_location(
+    "idml_utilities", Path(__file__).resolve().parents[1] / "scripts" / "utilities.py"
+)
+_utilities = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _utilities
+_spec.loader.exec_module(_utilities)
+XMLEditor = _utilities.XMLEditor
+
+_STORY = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<idPkg:Story xmlns:idPkg="http://ns.adobe.com/AdobeInDesign/idml/1.0/packaging" DOMVersion="8.0">
+<Story Self="u10"><ParagraphStyleRange><CharacterStyleRange><Content>Bold bit</Content></CharacterStyleRange></ParagraphStyleRange></Story>
+<Story Self="u20"/>
+</idPkg:Story>
+"""
+
+
+class GetNodeLineNumberTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        path = Path(self._tmp.name) / "Story_u10.xml"
+        path.write_text(_STORY, encoding="utf-8")
+        self.editor = XMLEditor(path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_tag_and_line(self):
+        node = self.editor.get_node(tag="Story", line_number=3)
+        self.assertEqual(node.getAttribute("Self"), "u10")
+
+    def test_wildcard_tag_and_line(self):
+        node = self.editor.get_node(tag="*", line_number=3, attrs={"Self": "u10"})
+        self.assertEqual(node.tagName, "Story")
+
+    def test_wildcard_tag_and_line_range(self):
+        node = self.editor.get_node(tag="*", line_number=range(3, 5), attrs={"Self": "u20"})
+        self.assertEqual(node.tagName, "Story")
+
+    def test_wildcard_skips_other_lines(self):
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="*", line_number=5, attrs={"Self": "u10"})
+
+
+if __name__ == "__main__":
+    unittest.main()
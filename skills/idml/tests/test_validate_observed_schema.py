@@ -0,0 +1,92 @@
+"""Tests for validate_observed_schema's streaming issue collection."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Loaded by path: the ODT skill also has a top-level ``scripts`` package.
+# The module imports idml_common bare when it is not loaded as scripts.*
+_SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+
+
+def _load(module_name: str, file_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, _SCRIPTS / file_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_load("idml_common", "idml_common.py")
+validate_observed_schema = _load("idml_validate_observed_schema", "validate_observed_schema.py")
+
+_SCHEMA = {
+    "elements": {
+        "Story": {"attributes": {"Self": {}}, "children": {"ParagraphStyleRange": 1}},
+        "ParagraphStyleRange": {
+            "attributes": {"AppliedParagraphStyle": {}},
+            "children": {"CharacterStyleRange": 1},
+        },
+        "CharacterStyleRange": {"attributes": {}, "children": {"Content": 1}},
+        "Content": {"attributes": {}, "children": {}},
+        # An empty entry counts as unknown, as it always has
+        "Br": {},
+    }
+}
+
+_STORY = b"""<?xml version="1.0"?>
+<Story Self="u1" Extra="x"><ParagraphStyleRange AppliedParagraphStyle="P/Body"><CharacterStyleRange Bold="1"><Content>a</Content><Br/><Table><Cell><Content>b</Content></Cell></Table></CharacterStyleRange><Content>c</Content></ParagraphStyleRange><ParagraphStyleRange/></Story>"""
+
+_FILE = "Stories/Story_u1.xml"
+_CSR = f"{_FILE}/Story/ParagraphStyleRange[0]/CharacterStyleRange[0]"
+
+
+def _child(path, tag, child_tag, index):
+    return {"file": _FILE, "path": path, "tag": tag, "child_tag": child_tag, "index": index}
+
+
+# What the earlier recursive walk over the fully parsed tree reported
+_EXPECTED = {
+    "unknown_elements": [
+        {"file": _FILE, "path": f"{_CSR}/Br[1]", "tag": "Br"},
+        {"file": _FILE, "path": f"{_CSR}/Table[2]", "tag": "Table"},
+        {"file": _FILE, "path": f"{_CSR}/Table[2]/Cell[0]", "tag": "Cell"},
+    ],
+    "unknown_attributes": [
+        {"file": _FILE, "path": f"{_FILE}/Story", "tag": "Story", "attr": "Extra"},
+        {"file": _FILE, "path": _CSR, "tag": "CharacterStyleRange", "attr": "Bold"},
+    ],
+    "unknown_children": [
+        _child(_CSR, "CharacterStyleRange", "Br", 1),
+        _child(_CSR, "CharacterStyleRange", "Table", 2),
+        _child(f"{_CSR}/Table[2]", "Table", "Cell", 0),
+        _child(f"{_CSR}/Table[2]/Cell[0]", "Cell", "Content", 0),
+        _child(f"{_FILE}/Story/ParagraphStyleRange[0]", "ParagraphStyleRange", "Content", 1),
+    ],
+}
+
+
+class CollectIssuesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        schema_path = Path(self._tmp.name) / "schema.json"
+        schema_path.write_text(json.dumps(_SCHEMA), encoding="utf-8")
+        self.schema = validate_observed_schema._load_schema(schema_path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_nested_issues_match_recursive_walk(self):
+        issues = {key: [] for key in validate_observed_schema._ISSUE_KEYS}
+        validate_observed_schema._collect_issues(self.schema, io.BytesIO(_STORY), issues, _FILE)
+        self.assertEqual(issues, _EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
-import runpy
+import sys
 from pathlib import Path
 
-SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "set_language.py"
-runpy.run_path(str(SCRIPT), run_name="__main__")
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from scripts.set_language import main  # noqa: E402
+
+if __name__ == "__main__":
+    raise SystemExit(main())
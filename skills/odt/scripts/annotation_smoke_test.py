@@ -4,25 +4,13 @@
 from __future__ import annotations
 
 import argparse
-import runpy
 import sys
 from pathlib import Path
 
+from scripts import pack_odt, unpack_odt, validate_odt
 from scripts.odt_document import ODTDocument
 
 
-def _run_script(script: Path, args: list[str]) -> None:
-    old_argv = sys.argv
-    try:
-        sys.argv = [str(script)] + args
-        runpy.run_path(str(script), run_name="__main__")
-    except SystemExit as exc:
-        if exc.code not in (0, None):
-            raise
-    finally:
-        sys.argv = old_argv
-
-
 def main() -> int:
     parser = argparse.ArgumentParser(description="Annotation smoke test")
     parser.add_argument("odt_file", help="Path to .odt file")
@@ -33,15 +21,16 @@ def main() -> int:
     args = parser.parse_args()
 
     odt_file = Path(args.odt_file)
+    if not odt_file.is_file():
+        print(f"File not found: {odt_file}", file=sys.stderr)
+        return 1
     work_dir = Path(args.work_dir)
     work_dir.mkdir(parents=True, exist_ok=True)
 
     unpack_dir = work_dir / "unpacked"
     out_file = work_dir / args.out
 
-    scripts_dir = Path(__file__).resolve().parent
-
-    _run_script(scripts_dir / "unpack_odt.py", [str(odt_file), str(unpack_dir)])
+    unpack_odt.unpack_odt(str(odt_file), str(unpack_dir))
 
     odt = ODTDocument(unpack_dir)
     content = odt["content.xml"]
@@ -53,8 +42,9 @@ def main() -> int:
     odt.add_annotation(node, args.text, author=args.author)
     odt.save()
 
-    _run_script(scripts_dir / "pack_odt.py", [str(unpack_dir), str(out_file)])
-    _run_script(scripts_dir / "validate_odt.py", [str(unpack_dir), "--original", str(out_file)])
+    pack_odt.pack_odt(str(unpack_dir), str(out_file))
+    if validate_odt.validate(unpack_dir, out_file, manifest=odt.manifest):
+        return 1
 
     print(f"Annotation smoke test completed: {out_file}")
     return 0
@@ -5,25 +5,13 @@ from __future__ import annotations
 
 import argparse
 import html
-import runpy
 import sys
 from pathlib import Path
 
+from scripts import pack_odt, unpack_odt, validate_changes, validate_odt
 from scripts.odt_document import ODTDocument
 
 
-def _run_script(script: Path, args: list[str]) -> None:
-    old_argv = sys.argv
-    try:
-        sys.argv = [str(script)] + args
-        runpy.run_path(str(script), run_name="__main__")
-    except SystemExit as exc:
-        if exc.code not in (0, None):
-            raise
-    finally:
-        sys.argv = old_argv
-
-
 def _build_replacement_xml(node, text: str) -> str:
     escaped = html.escape(text)
     style = node.getAttribute("text:style-name")
@@ -43,15 +31,16 @@ def main() -> int:
     args = parser.parse_args()
 
     odt_file = Path(args.odt_file)
+    if not odt_file.is_file():
+        print(f"File not found: {odt_file}", file=sys.stderr)
+        return 1
     work_dir = Path(args.work_dir)
     work_dir.mkdir(parents=True, exist_ok=True)
 
     unpack_dir = work_dir / "unpacked"
     out_file = work_dir / args.out
 
-    scripts_dir = Path(__file__).resolve().parent
-
-    _run_script(scripts_dir / "unpack_odt.py", [str(odt_file), str(unpack_dir)])
+    unpack_odt.unpack_odt(str(odt_file), str(unpack_dir))
 
     odt = ODTDocument(unpack_dir)
     node = odt["content.xml"].get_node(tag="text:p", contains=args.search)
@@ -59,9 +48,11 @@ def main() -> int:
     odt.suggest_replacement(node, replacement_xml, author=args.author)
     odt.save()
 
-    _run_script(scripts_dir / "validate_changes.py", [str(unpack_dir / "content.xml")])
-    _run_script(scripts_dir / "pack_odt.py", [str(unpack_dir), str(out_file)])
-    _run_script(scripts_dir / "validate_odt.py", [str(unpack_dir), "--original", str(out_file)])
+    if validate_changes.validate(unpack_dir / "content.xml"):
+        return 1
+    pack_odt.pack_odt(str(unpack_dir), str(out_file))
+    if validate_odt.validate(unpack_dir, out_file, manifest=odt.manifest):
+        return 1
 
     print(f"Tracked-change example completed: {out_file}")
     return 0
@@ -4,8 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import os
+import shutil
 import sys
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 BASE_URL = "https://docs.oasis-open.org/office/OpenDocument/v1.3/os/schemas"
@@ -16,13 +19,20 @@ FILES = [
     "OpenDocument-v1.3-metadata.owl",
     "OpenDocument-v1.3-package-metadata.owl",
 ]
+_CHUNK_SIZE = 128 * 1024
 
 
 def download_file(url: str, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
-    with urllib.request.urlopen(url) as resp:  # nosec - controlled source
-        data = resp.read()
-    dest.write_bytes(data)
+    tmp = dest.with_name(dest.name + ".part")
+    try:
+        with urllib.request.urlopen(url) as resp, open(tmp, "wb") as f:  # nosec - controlled source
+            shutil.copyfileobj(resp, f, _CHUNK_SIZE)
+        os.replace(tmp, dest)
+    except BaseException:
+        # Don't leave a partial download behind (including on Ctrl-C)
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def main() -> int:
@@ -42,15 +52,17 @@ def main() -> int:
     out_dir = Path(args.out)
     base = args.base_url.rstrip("/")
 
-    for name in FILES:
-        url = f"{base}/{name}"
-        dest = out_dir / name
-        try:
-            download_file(url, dest)
-            print(f"Downloaded: {dest}")
-        except Exception as exc:
-            print(f"Failed to download {url}: {exc}", file=sys.stderr)
-            return 1
+    jobs = [(f"{base}/{name}", out_dir / name) for name in FILES]
+    # Downloads overlap; results are still reported in FILES order
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        futures = [ex.submit(download_file, url, dest) for url, dest in jobs]
+        for (url, dest), future in zip(jobs, futures):
+            try:
+                future.result()
+                print(f"Downloaded: {dest}")
+            except Exception as exc:
+                print(f"Failed to download {url}: {exc}", file=sys.stderr)
+                return 1
 
     return 0
 
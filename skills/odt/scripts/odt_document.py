@@ -23,10 +23,12 @@ Usage:
 from __future__ import annotations
 
 import mimetypes
-import random
 import shutil
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
+from secrets import token_hex
+from xml.etree.ElementTree import SubElement  # building elements needs no defusing
 
 try:
     from defusedxml import ElementTree as ET
@@ -37,6 +39,9 @@ from .utilities import XMLEditor
 
 MANIFEST_NS = "urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"
 ODT_MIMETYPE = "application/vnd.oasis.opendocument.text"
+_FILE_ENTRY = f"{{{MANIFEST_NS}}}file-entry"
+_FULL_PATH = f"{{{MANIFEST_NS}}}full-path"
+_MEDIA_TYPE = f"{{{MANIFEST_NS}}}media-type"
 
 
 def _first_last_elements(nodes):
@@ -60,8 +65,27 @@ class ODTDocument:
         if not self._manifest_path.exists():
             raise ValueError("Missing META-INF/manifest.xml in unpacked ODT")
 
-        self._manifest_tree = ET.parse(self._manifest_path)
-        self._manifest_root = self._manifest_tree.getroot()
+    @cached_property
+    def _manifest_tree(self):
+        # Parsed on first use; save() always parses it to repair the root entry
+        return ET.parse(self._manifest_path)
+
+    @cached_property
+    def _manifest_root(self):
+        return self._manifest_tree.getroot()
+
+    @cached_property
+    def _manifest_index(self) -> dict:
+        # full-path -> file-entry; the first entry wins, as a findall scan would
+        index = {}
+        for elem in self._manifest_root.findall(_FILE_ENTRY):
+            index.setdefault(elem.get(_FULL_PATH), elem)
+        return index
+
+    @property
+    def manifest(self):
+        """Root element of the parsed META-INF/manifest.xml."""
+        return self._manifest_root
 
     def __getitem__(self, rel_path: str) -> XMLEditor:
         path = self.root / rel_path
@@ -73,8 +97,7 @@ class ODTDocument:
 
     def new_change_id(self, prefix: str = "ct") -> str:
         """Generate a change-id for tracked changes (use as text:change-id)."""
-        suffix = "".join(random.choices("0123456789abcdef", k=8))
-        return f"{prefix}{suffix}"
+        return f"{prefix}{token_hex(4)}"
 
     def ensure_tracked_changes(self):
         """Ensure <text:tracked-changes> exists in content.xml and return it."""
@@ -93,18 +116,18 @@ class ODTDocument:
 
         # Insert after any <text:sequence-decls> if present, otherwise first element
         insert_after = None
+        first_elem = None
         for node in parent.childNodes:
-            if node.nodeType == node.ELEMENT_NODE and node.tagName == "text:sequence-decls":
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            if first_elem is None:
+                first_elem = node
+            if node.tagName == "text:sequence-decls":
                 insert_after = node
 
         if insert_after is not None and insert_after.nextSibling is not None:
             parent.insertBefore(tracked, insert_after.nextSibling)
         else:
-            first_elem = None
-            for node in parent.childNodes:
-                if node.nodeType == node.ELEMENT_NODE:
-                    first_elem = node
-                    break
             if first_elem is None:
                 parent.appendChild(tracked)
             else:
@@ -179,17 +202,19 @@ class ODTDocument:
     ) -> str:
         """Insert an office:annotation element before a target node."""
         content = self["content.xml"]
-        annotation_name = name or "c" + "".join(random.choices("0123456789abcdef", k=6))
+        annotation_name = name or "c" + token_hex(3)
         timestamp = date or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        xml = (
-            f'<office:annotation office:name="{annotation_name}">'
-            f"<dc:creator>{author}</dc:creator>"
-            f"<dc:date>{timestamp}</dc:date>"
-            f"<text:p>{text}</text:p>"
-            f"</office:annotation>"
-        )
-        content.insert_before(target_elem, xml)
+        # Built as DOM nodes so author/text are escaped and nothing is re-parsed
+        dom = content.dom
+        annotation = dom.createElement("office:annotation")
+        annotation.setAttribute("office:name", annotation_name)
+        for tag, value in (("dc:creator", author), ("dc:date", timestamp), ("text:p", text)):
+            child = dom.createElement(tag)
+            child.appendChild(dom.createTextNode(value))
+            annotation.appendChild(child)
+
+        target_elem.parentNode.insertBefore(annotation, target_elem)
         return annotation_name
 
     def add_annotation_range(
@@ -221,19 +246,22 @@ class ODTDocument:
 
     def suggest_deletion(self, target_elem, author: str = "Claude") -> str:
         """Remove content and record a deletion change at its former location."""
+        change_id, _ = self._record_deletion(target_elem, author)
+        return change_id
+
+    def _record_deletion(self, target_elem, author: str):
+        """suggest_deletion that also returns the inserted <text:change> marker."""
         content_xml = target_elem.toxml()
         change_id = self.add_change_record("deletion", author=author, content_xml=content_xml)
         content = self["content.xml"]
         marker_nodes = content.insert_after(target_elem, f'<text:change text:change-id=\"{change_id}\"/>')
         content.remove_node(target_elem)
-        return change_id
+        return change_id, marker_nodes[0]
 
     def suggest_replacement(self, target_elem, xml_content: str, author: str = "Claude") -> tuple[str, str]:
         """Replace content by recording a deletion then insertion."""
-        del_id = self.suggest_deletion(target_elem, author=author)
         # Insert replacement after the deletion marker
-        content = self["content.xml"]
-        marker = content.get_node(tag="text:change", attrs={"text:change-id": del_id})
+        del_id, marker = self._record_deletion(target_elem, author)
         ins_id = self.suggest_insertion(marker, xml_content, author=author)
         return del_id, ins_id
 
@@ -242,15 +270,16 @@ class ODTDocument:
         if full_path.startswith("/"):
             full_path = full_path.lstrip("/")
 
-        for elem in self._manifest_root.findall(f"{{{MANIFEST_NS}}}file-entry"):
-            if elem.get(f"{{{MANIFEST_NS}}}full-path") == full_path:
-                if media_type and not elem.get(f"{{{MANIFEST_NS}}}media-type"):
-                    elem.set(f"{{{MANIFEST_NS}}}media-type", media_type)
-                return
+        elem = self._manifest_index.get(full_path)
+        if elem is not None:
+            if media_type and not elem.get(_MEDIA_TYPE):
+                elem.set(_MEDIA_TYPE, media_type)
+            return
 
-        entry = ET.SubElement(self._manifest_root, f"{{{MANIFEST_NS}}}file-entry")
-        entry.set(f"{{{MANIFEST_NS}}}full-path", full_path)
-        entry.set(f"{{{MANIFEST_NS}}}media-type", media_type)
+        entry = SubElement(self._manifest_root, _FILE_ENTRY)
+        entry.set(_FULL_PATH, full_path)
+        entry.set(_MEDIA_TYPE, media_type)
+        self._manifest_index[full_path] = entry
 
     def add_picture(self, file_path: str | Path, dest_name: str | None = None) -> str:
         """Copy an image into Pictures/ and add a manifest entry.
@@ -266,7 +295,7 @@ class ODTDocument:
 
         target_name = dest_name or src.name
         dest = pictures_dir / target_name
-        shutil.copy2(src, dest)
+        shutil.copyfile(src, dest)
 
         media_type, _ = mimetypes.guess_type(dest.name)
         media_type = media_type or "application/octet-stream"
@@ -281,14 +310,11 @@ class ODTDocument:
             editor.save()
 
         # Ensure root entry exists and is correct
-        root_entry = None
-        for elem in self._manifest_root.findall(f"{{{MANIFEST_NS}}}file-entry"):
-            if elem.get(f"{{{MANIFEST_NS}}}full-path") == "/":
-                root_entry = elem
-                break
+        root_entry = self._manifest_index.get("/")
         if root_entry is None:
-            root_entry = ET.SubElement(self._manifest_root, f"{{{MANIFEST_NS}}}file-entry")
-            root_entry.set(f"{{{MANIFEST_NS}}}full-path", "/")
-        root_entry.set(f"{{{MANIFEST_NS}}}media-type", ODT_MIMETYPE)
+            root_entry = SubElement(self._manifest_root, _FILE_ENTRY)
+            root_entry.set(_FULL_PATH, "/")
+            self._manifest_index["/"] = root_entry
+        root_entry.set(_MEDIA_TYPE, ODT_MIMETYPE)
 
         self._manifest_tree.write(self._manifest_path, encoding="UTF-8", xml_declaration=True)
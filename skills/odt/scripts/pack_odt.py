@@ -9,15 +9,16 @@ import sys
 import zipfile
 
 
-def pack_odt(src_dir: str, out_path: str) -> None:
+def pack_odt(src_dir: str, out_path: str, compresslevel: int = 1) -> None:
+    """Zip src_dir; compresslevel 0 stores entries, 1-9 selects the deflate level."""
+    compress_type = zipfile.ZIP_DEFLATED if compresslevel > 0 else zipfile.ZIP_STORED
     mime_path = os.path.join(src_dir, "mimetype")
     if not os.path.isfile(mime_path):
         raise FileNotFoundError("Missing mimetype file in source directory")
 
     with zipfile.ZipFile(out_path, "w") as zf:
         # ODF requires mimetype first and uncompressed
-        with open(mime_path, "rb") as f:
-            zf.writestr("mimetype", f.read(), compress_type=zipfile.ZIP_STORED)
+        zf.write(mime_path, "mimetype", compress_type=zipfile.ZIP_STORED)
 
         for root, _, files in os.walk(src_dir):
             for name in files:
@@ -25,20 +26,28 @@ def pack_odt(src_dir: str, out_path: str) -> None:
                 rel_path = os.path.relpath(full_path, src_dir)
                 if rel_path == "mimetype":
                     continue
-                zf.write(full_path, rel_path, compress_type=zipfile.ZIP_DEFLATED)
+                zf.write(full_path, rel_path, compress_type=compress_type, compresslevel=compresslevel)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Pack directory into .odt")
     parser.add_argument("src_dir", help="Unpacked ODT directory")
     parser.add_argument("out_odt", help="Output .odt path")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="{0-9}",
+        help="Deflate level; 0 stores entries uncompressed (default: 1, fastest)",
+    )
+    args = parser.parse_args(argv)
 
     if not os.path.isdir(args.src_dir):
         print(f"Directory not found: {args.src_dir}", file=sys.stderr)
         return 1
 
-    pack_odt(args.src_dir, args.out_odt)
+    pack_odt(args.src_dir, args.out_odt, args.compresslevel)
     return 0
 
 
@@ -5,62 +5,107 @@ from __future__ import annotations
 
 import argparse
 import os
-import random
 import sys
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from secrets import token_hex
 
 try:
     from defusedxml import minidom
 except Exception:  # pragma: no cover - fallback when defusedxml is unavailable
     from xml.dom import minidom
 
-
-def _is_safe_path(base_dir: str, target_path: str) -> bool:
-    base = os.path.abspath(base_dir)
-    target = os.path.abspath(target_path)
-    return os.path.commonpath([base]) == os.path.commonpath([base, target])
+try:
+    from lxml import etree as LET
+except Exception:  # pragma: no cover - minidom pretty-printing is used instead
+    LET = None
 
 
 def safe_extract(zip_path: str, out_dir: str) -> None:
+    base_abs = os.path.abspath(out_dir)
+    # The trailing separator keeps "out2" from passing as a child of "out"
+    base_prefix = os.path.join(base_abs, "")
     with zipfile.ZipFile(zip_path, "r") as zf:
+        # Check and extract each member in one pass instead of validating the
+        # whole listing and then letting extractall() walk it again
         for member in zf.infolist():
-            member_path = os.path.join(out_dir, member.filename)
-            if not _is_safe_path(out_dir, member_path):
+            # base_abs is absolute, so this only normalizes (no getcwd per member)
+            target = os.path.abspath(os.path.join(base_abs, member.filename))
+            if target != base_abs and not target.startswith(base_prefix):
                 raise ValueError(f"Unsafe path in zip: {member.filename}")
-        zf.extractall(out_dir)
+            zf.extract(member, out_dir)
 
 
-def _pretty_print_xml_files(out_dir: str) -> None:
+def _pretty_print_xml_file(xml_file: Path) -> None:
+    if LET is not None:
+        # Entities stay unexpanded and nothing is fetched, as with defusedxml.
+        # Blank text is kept: whitespace between spans is content in ODF.
+        parser = LET.XMLParser(resolve_entities=False, no_network=True)
+        try:
+            tree = LET.parse(str(xml_file), parser)
+        except LET.Error:
+            # e.g. a part over libxml2's size limits: fall back to minidom below
+            pass
+        else:
+            tree.write(
+                str(xml_file),
+                encoding="utf-8",
+                xml_declaration=True,
+                standalone=True if tree.docinfo.standalone else None,
+                pretty_print=True,
+            )
+            return
+
+    content = xml_file.read_text(encoding="utf-8")
+    if not content.strip():
+        return
+    try:
+        dom = minidom.parseString(content)
+    except Exception as exc:
+        # Leave files that are not well-formed XML as extracted
+        print(f"Not pretty-printing {xml_file}: {exc}", file=sys.stderr)
+        return
+    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
+
+
+def _pretty_print_xml_files(out_dir: str, jobs: int = 1) -> None:
     base = Path(out_dir)
     xml_files = list(base.rglob("*.xml"))
-    for xml_file in xml_files:
-        content = xml_file.read_text(encoding="utf-8")
-        if not content.strip():
-            continue
-        try:
-            dom = minidom.parseString(content)
-        except Exception:
-            # Skip files that are not well-formed XML
-            continue
-        xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
+    # An ODT holds only a handful of XML parts, so a process pool is opt-in
+    if jobs == 1 or len(xml_files) < 2:
+        for xml_file in xml_files:
+            _pretty_print_xml_file(xml_file)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        list(ex.map(_pretty_print_xml_file, xml_files, chunksize=2))
+
+
+def unpack_odt(odt_file: str, out_dir: str, jobs: int = 1) -> None:
+    os.makedirs(out_dir, exist_ok=True)
+    safe_extract(odt_file, out_dir)
+    _pretty_print_xml_files(out_dir, jobs)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Unpack ODT into a directory")
     parser.add_argument("odt_file", help="Path to .odt file")
     parser.add_argument("out_dir", help="Output directory")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for pretty-printing XML (default: 1, no process pool)",
+    )
+    args = parser.parse_args(argv)
 
     if not os.path.isfile(args.odt_file):
         print(f"File not found: {args.odt_file}", file=sys.stderr)
         return 1
 
-    os.makedirs(args.out_dir, exist_ok=True)
-    safe_extract(args.odt_file, args.out_dir)
-    _pretty_print_xml_files(args.out_dir)
+    unpack_odt(args.odt_file, args.out_dir, args.jobs)
 
-    suggested_change_id = "ct" + "".join(random.choices("0123456789abcdef", k=8))
+    suggested_change_id = "ct" + token_hex(4)
     print(f"Suggested change-id for tracked changes: {suggested_change_id}")
     return 0
 
@@ -30,12 +30,16 @@ Example usage:
 from __future__ import annotations
 
 import html
+import os
+import shutil
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
 
+_BUFFER_SIZE = 1 << 20
+
 
 class XMLEditor:
     """
@@ -66,11 +70,14 @@ class XMLEditor:
             raise ValueError(f"XML file not found: {xml_path}")
 
         with open(self.xml_path, "rb") as f:
-            header = f.read(200).decode("utf-8", errors="ignore")
-        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+            header = f.read(200)
+        self.encoding = "ascii" if b'encoding="ascii"' in header else "utf-8"
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        # Namespace declarations wrapped around every parsed fragment
+        self._ns_decl: Optional[str] = None
+        self._ns_decl_root = None
 
     def get_node(
         self,
@@ -97,8 +104,15 @@ class XMLEditor:
         Raises:
             ValueError: If node not found or multiple matches found
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        match = None
+        attr_items = tuple(attrs.items()) if attrs else ()
+        # The common single-attribute query skips the all() generator
+        single_attr = attr_items[0] if len(attr_items) == 1 else None
+        normalized_contains = html.unescape(contains) if contains is not None else None
+        # id(element) -> subtree text for this call; candidates come in document
+        # order, so a nested candidate reuses the text gathered for its ancestor
+        text_cache: dict[int, str] = {}
+        for elem in _iter_elements(self.dom, tag):
             # Check line_number filter
             if line_number is not None:
                 parse_pos = getattr(elem, "parse_position", (None,))
@@ -113,23 +127,29 @@ class XMLEditor:
                         continue
 
             # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
+            if single_attr is not None:
+                if elem.getAttribute(single_attr[0]) != single_attr[1]:
                     continue
+            elif attr_items and not all(
+                elem.getAttribute(attr_name) == attr_value
+                for attr_name, attr_value in attr_items
+            ):
+                continue
 
             # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
+            if normalized_contains is not None:
+                if normalized_contains not in self._get_element_text(elem, text_cache):
                     continue
 
-            matches.append(elem)
+            if match is not None:
+                # Exactly one match is required, so stop at the second
+                raise ValueError(
+                    f"Multiple nodes found: <{tag}>. "
+                    f"Add more filters (attrs, line_number, or contains) to narrow the search."
+                )
+            match = elem
 
-        if not matches:
+        if match is None:
             filters = []
             if line_number is not None:
                 line_str = (
@@ -156,12 +176,7 @@ class XMLEditor:
                 hint = "Try adding filters (attrs, line_number, or contains)."
 
             raise ValueError(f"{base_msg}. {hint}")
-        if len(matches) > 1:
-            raise ValueError(
-                f"Multiple nodes found: <{tag}>. "
-                f"Add more filters (attrs, line_number, or contains) to narrow the search."
-            )
-        return matches[0]
+        return match
 
     def replace_node(self, elem, xml_content):
         """
@@ -209,31 +224,65 @@ class XMLEditor:
         parent.removeChild(elem)
 
     def save(self):
-        """Save the edited XML back to the file."""
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        """
+        Save the edited XML back to the file.
 
-    def _get_element_text(self, elem):
+        The document is streamed to a sibling temp file with the same encoder
+        settings as toxml() and then swapped into place with os.replace(), so
+        the serialized document is never held in memory as a single string and
+        a failed write leaves the original file untouched. The temp file takes
+        the original file's mode and is removed if anything goes wrong.
+        """
+        tmp_path = self.xml_path.with_name(self.xml_path.name + ".tmp")
+        try:
+            with open(
+                tmp_path,
+                "w",
+                encoding=self.encoding,
+                errors="xmlcharrefreplace",
+                newline="\n",
+                buffering=_BUFFER_SIZE,
+            ) as f:
+                self.dom.writexml(f, encoding=self.encoding)
+            shutil.copymode(self.xml_path, tmp_path)
+            os.replace(tmp_path, self.xml_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _get_element_text(self, elem, cache=None):
+        if cache is not None:
+            cached = cache.get(id(elem))
+            if cached is not None:
+                return cached
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
                 if node.data.strip():
                     text_parts.append(node.data)
             else:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+                text_parts.append(self._get_element_text(node, cache))
+        text = "".join(text_parts)
+        if cache is not None:
+            cache[id(elem)] = text
+        return text
 
-    def _parse_fragment(self, xml_content):
+    def _namespace_decl(self):
         root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        # Recomputed only if the document element itself was replaced
+        if self._ns_decl is None or self._ns_decl_root is not root_elem:
+            namespaces = []
+            if root_elem and root_elem.attributes:
+                for i in range(root_elem.attributes.length):
+                    attr = root_elem.attributes.item(i)
+                    if attr.name.startswith("xmlns"):  # type: ignore
+                        namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._ns_decl = " ".join(namespaces)
+            self._ns_decl_root = root_elem
+        return self._ns_decl
+
+    def _parse_fragment(self, xml_content):
+        wrapper = f"<root {self._namespace_decl()}>{xml_content}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
         nodes = [
             self.dom.importNode(child, deep=True)
@@ -244,6 +293,25 @@ class XMLEditor:
         return nodes
 
 
+def _iter_elements(node, tag):
+    """
+    Lazily yield descendant elements named tag in document order.
+
+    Same order and matching as getElementsByTagName (including "*"), but as a
+    generator, so callers can stop walking as soon as they have an answer.
+    """
+    stack = [iter(node.childNodes)]
+    while stack:
+        for child in stack[-1]:
+            if child.nodeType == child.ELEMENT_NODE:
+                if tag == "*" or child.tagName == tag:
+                    yield child
+                stack.append(iter(child.childNodes))
+                break
+        else:
+            stack.pop()
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
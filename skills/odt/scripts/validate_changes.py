@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import argparse
 import sys
-from collections import Counter
 from pathlib import Path
 
 try:
@@ -21,14 +20,13 @@ except Exception:  # pragma: no cover
 
 CONTENT_NS = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
 TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
-
-
-def _ns(tag: str) -> str:
-    if tag.startswith("text:"):
-        return f"{{{TEXT_NS}}}" + tag.split(":", 1)[1]
-    if tag.startswith("office:"):
-        return f"{{{CONTENT_NS}}}" + tag.split(":", 1)[1]
-    return tag
+_TRACKED_CHANGES = f"{{{TEXT_NS}}}tracked-changes"
+_CHANGED_REGION = f"{{{TEXT_NS}}}changed-region"
+_CHANGE_START = f"{{{TEXT_NS}}}change-start"
+_CHANGE_END = f"{{{TEXT_NS}}}change-end"
+_CHANGE = f"{{{TEXT_NS}}}change"
+_TEXT_ID = f"{{{TEXT_NS}}}id"
+_CHANGE_ID = f"{{{TEXT_NS}}}change-id"
 
 
 def validate(content_xml: Path) -> int:
@@ -36,42 +34,45 @@ def validate(content_xml: Path) -> int:
         print(f"Missing content.xml: {content_xml}", file=sys.stderr)
         return 1
 
-    tree = ET.parse(content_xml)
-    root = tree.getroot()
+    # Markers are reported per kind, in document order within each kind
+    marker_ids: dict[str, list] = {_CHANGE_START: [], _CHANGE_END: [], _CHANGE: []}
 
-    tracked = root.findall(f".//{_ns('text:tracked-changes')}")
+    # One streaming pass; finished elements are cleared so memory stays
+    # bounded by depth rather than document size
     change_ids = set()
-    for tracked_el in tracked:
-        for region in tracked_el.findall(_ns("text:changed-region")):
-            change_id = region.get(_ns("text:id"))
+    start_counts: dict[str, int] = {}
+    end_counts: dict[str, int] = {}
+    stack: list[str] = []
+    for event, elem in ET.iterparse(content_xml, events=("start", "end")):
+        if event == "start":
+            stack.append(elem.tag)
+            continue
+        stack.pop()
+        tag = elem.tag
+        if tag == _CHANGED_REGION and stack and stack[-1] == _TRACKED_CHANGES:
+            change_id = elem.get(_TEXT_ID)
             if change_id:
                 change_ids.add(change_id)
-
-    markers = []
-    for tag in ("text:change-start", "text:change-end", "text:change"):
-        markers.extend(root.findall(f".//{_ns(tag)}"))
+        elif tag in marker_ids:
+            cid = elem.get(_CHANGE_ID)
+            marker_ids[tag].append(cid)
+            if cid:
+                if tag == _CHANGE_START:
+                    start_counts[cid] = start_counts.get(cid, 0) + 1
+                elif tag == _CHANGE_END:
+                    end_counts[cid] = end_counts.get(cid, 0) + 1
+        elem.clear()
 
     errors = []
     warnings = []
 
-    ref_ids = []
-    for m in markers:
-        cid = m.get(_ns("text:change-id"))
-        if cid:
-            ref_ids.append(cid)
-            if cid not in change_ids:
-                errors.append(f"Marker references unknown change-id: {cid}")
-
-    starts = [
-        m.get(_ns("text:change-id"))
-        for m in root.findall(f".//{_ns('text:change-start')}")
-    ]
-    ends = [
-        m.get(_ns("text:change-id"))
-        for m in root.findall(f".//{_ns('text:change-end')}")
-    ]
-    start_counts = Counter([s for s in starts if s])
-    end_counts = Counter([e for e in ends if e])
+    ref_ids = set()
+    for ids in marker_ids.values():
+        for cid in ids:
+            if cid:
+                ref_ids.add(cid)
+                if cid not in change_ids:
+                    errors.append(f"Marker references unknown change-id: {cid}")
 
     for cid, count in start_counts.items():
         if end_counts.get(cid, 0) < count:
@@ -96,10 +97,10 @@ def validate(content_xml: Path) -> int:
     return 0 if not errors else 1
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Validate ODT tracked changes in content.xml")
     parser.add_argument("content_xml", help="Path to content.xml")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     return validate(Path(args.content_xml))
 
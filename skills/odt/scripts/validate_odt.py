@@ -15,7 +15,7 @@ import argparse
 import sys
 import zipfile
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 try:
     from defusedxml import ElementTree as ET
@@ -24,6 +24,9 @@ except Exception:  # pragma: no cover - fallback when defusedxml is unavailable
 
 ODT_MIMETYPE = "application/vnd.oasis.opendocument.text"
 MANIFEST_NS = "urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"
+_FILE_ENTRY = f"{{{MANIFEST_NS}}}file-entry"
+_FULL_PATH = f"{{{MANIFEST_NS}}}full-path"
+_MEDIA_TYPE = f"{{{MANIFEST_NS}}}media-type"
 
 
 def _iter_zip_files(zf: zipfile.ZipFile) -> Iterable[str]:
@@ -33,23 +36,29 @@ def _iter_zip_files(zf: zipfile.ZipFile) -> Iterable[str]:
         yield info.filename
 
 
-def _read_manifest(manifest_path: Path) -> list[dict[str, str]]:
-    tree = ET.parse(manifest_path)
-    root = tree.getroot()
-    entries = []
-    for elem in root.findall(f"{{{MANIFEST_NS}}}file-entry"):
-        entries.append({
-            "full_path": elem.get(f"{{{MANIFEST_NS}}}full-path", ""),
-            "media_type": elem.get(f"{{{MANIFEST_NS}}}media-type", ""),
-        })
-    return entries
+def _read_manifest(manifest_path: Path) -> Iterator[tuple[str, str]]:
+    """Yield (full_path, media_type) per file-entry, streaming the manifest."""
+    for _, elem in ET.iterparse(manifest_path, events=("end",)):
+        if elem.tag == _FILE_ENTRY:
+            yield elem.get(_FULL_PATH, ""), elem.get(_MEDIA_TYPE, "")
+            elem.clear()
+
+
+def _manifest_entries(root) -> Iterator[tuple[str, str]]:
+    for elem in root.iterfind(_FILE_ENTRY):
+        yield elem.get(_FULL_PATH, ""), elem.get(_MEDIA_TYPE, "")
 
 
 def _normalize_manifest_path(path: str) -> str:
     return path.lstrip("/")
 
 
-def validate(unpacked_dir: Path, original_file: Path, verbose: bool = False) -> int:
+def validate(unpacked_dir: Path, original_file: Path, verbose: bool = False, manifest=None) -> int:
+    """Validate an unpacked ODT against its packed file.
+
+    manifest: already-parsed manifest.xml root (e.g. ODTDocument.manifest) to
+    check instead of re-reading META-INF/manifest.xml from disk.
+    """
     errors: list[str] = []
     warnings: list[str] = []
 
@@ -59,32 +68,53 @@ def validate(unpacked_dir: Path, original_file: Path, verbose: bool = False) ->
         _print_results(errors, warnings, verbose)
         return 1
 
-    # Parse manifest entries
-    entries = _read_manifest(manifest_path)
-    manifest_paths = [e["full_path"] for e in entries]
+    # Single pass over the manifest entries
+    entries = _read_manifest(manifest_path) if manifest is None else _manifest_entries(manifest)
+    root_media_type = None
+    lists_manifest = lists_mimetype = False
+    manifest_declared = set()
+    for path, media_type in entries:
+        if path == "/":
+            if root_media_type is None:
+                root_media_type = media_type
+            continue
+        if path == "META-INF/manifest.xml":
+            lists_manifest = True
+            continue
+        if path == "mimetype":
+            lists_mimetype = True
+            continue
+        if path.endswith("/"):
+            continue
+        manifest_declared.add(_normalize_manifest_path(path))
 
     # Root entry
-    root_entry = next((e for e in entries if e["full_path"] == "/"), None)
-    if not root_entry:
+    if root_media_type is None:
         errors.append("Manifest missing root entry '/'")
-    else:
-        if root_entry.get("media_type") != ODT_MIMETYPE:
-            errors.append(
-                f"Root media type should be '{ODT_MIMETYPE}', got '{root_entry.get('media_type')}'"
-            )
+    elif root_media_type != ODT_MIMETYPE:
+        errors.append(
+            f"Root media type should be '{ODT_MIMETYPE}', got '{root_media_type}'"
+        )
 
     # Check manifest does not list itself or mimetype
-    if "META-INF/manifest.xml" in manifest_paths:
+    if lists_manifest:
         errors.append("Manifest should not list META-INF/manifest.xml")
-    if "mimetype" in manifest_paths:
+    if lists_mimetype:
         errors.append("Manifest should not list mimetype")
 
     # Compare manifest entries to zip contents
     with zipfile.ZipFile(original_file, "r") as zf:
-        zip_files = list(_iter_zip_files(zf))
+        # One pass collects the paths that should be in the manifest
+        zip_declared: set[str] = set()
+        has_mimetype = False
+        for path in _iter_zip_files(zf):
+            if path == "mimetype":
+                has_mimetype = True
+            elif not path.startswith("META-INF/"):
+                zip_declared.add(path)
 
         # Check mimetype placement/compression if present
-        if "mimetype" in zip_files:
+        if has_mimetype:
             first = zf.infolist()[0]
             if first.filename != "mimetype":
                 errors.append("mimetype must be the first ZIP entry")
@@ -93,20 +123,6 @@ def validate(unpacked_dir: Path, original_file: Path, verbose: bool = False) ->
         else:
             warnings.append("mimetype file not found in ZIP (recommended for ODF packages)")
 
-    # Build set of file paths that should be in manifest
-    zip_declared = set(
-        p for p in zip_files
-        if not p.startswith("META-INF/") and p != "mimetype"
-    )
-
-    manifest_declared = set()
-    for path in manifest_paths:
-        if path in ("/", "mimetype", "META-INF/manifest.xml"):
-            continue
-        if path.endswith("/"):
-            continue
-        manifest_declared.add(_normalize_manifest_path(path))
-
     # Files present but missing from manifest
     missing_in_manifest = sorted(zip_declared - manifest_declared)
     for path in missing_in_manifest:
@@ -135,12 +151,12 @@ def _print_results(errors: list[str], warnings: list[str], verbose: bool) -> Non
             print(f"- {w}")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Validate ODT package structure")
     parser.add_argument("unpacked_dir", help="Path to unpacked ODT directory")
     parser.add_argument("--original", required=True, help="Path to original .odt file")
     parser.add_argument("-v", "--verbose", action="store_true")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
@@ -20,33 +20,57 @@ def _default_schema(xml_path: Path, base_dir: Path) -> Path:
     return schemas_dir / "OpenDocument-v1.3-schema.rng"
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Validate ODF XML with jing")
-    parser.add_argument("xml_file", help="Path to XML file (content.xml, styles.xml, or manifest.xml)")
-    parser.add_argument("--schema", help="Path to RNG schema (optional)")
-    args = parser.parse_args()
+def validate(xml_path: Path, schema_path: Path | None = None) -> int:
+    return validate_files([xml_path], schema_path)
 
-    xml_path = Path(args.xml_file)
-    if not xml_path.is_file():
-        print(f"Not a file: {xml_path}", file=sys.stderr)
-        return 1
 
+def validate_files(xml_paths: list[Path], schema_path: Path | None = None) -> int:
+    """Validate several files with one jing run per schema.
+
+    Each jing run starts a JVM, so content.xml and styles.xml (same schema)
+    are checked together rather than one process per file.
+    """
+    # A missing file or schema fails only its own entry; the rest are still checked
+    returncode = 0
     base_dir = Path(__file__).resolve().parents[1]
-    schema_path = Path(args.schema) if args.schema else _default_schema(xml_path, base_dir)
+    groups: dict[Path, list[Path]] = {}
+    for xml_path in xml_paths:
+        if not xml_path.is_file():
+            print(f"Not a file: {xml_path}", file=sys.stderr)
+            returncode = 1
+            continue
+        groups.setdefault(schema_path or _default_schema(xml_path, base_dir), []).append(xml_path)
 
-    if not schema_path.is_file():
-        print(f"Schema not found: {schema_path}", file=sys.stderr)
-        print("Fetch schemas first: python scripts/fetch_odf_schemas.py --out odf/schemas/odf-1.3", file=sys.stderr)
-        return 1
+    for schema in list(groups):
+        if not schema.is_file():
+            print(f"Schema not found: {schema}", file=sys.stderr)
+            print("Fetch schemas first: python scripts/fetch_odf_schemas.py --out odf/schemas/odf-1.3", file=sys.stderr)
+            del groups[schema]
+            returncode = 1
+    if not groups:
+        return returncode
 
     jing = shutil.which("jing")
     if not jing:
         print("jing not found in PATH. Install jing to run RNG validation.", file=sys.stderr)
-        print(f"Then run: jing {schema_path} {xml_path}", file=sys.stderr)
+        for schema, paths in groups.items():
+            print(f"Then run: jing {schema} {' '.join(map(str, paths))}", file=sys.stderr)
         return 1
 
-    result = subprocess.run([jing, str(schema_path), str(xml_path)])
-    return result.returncode
+    for schema, paths in groups.items():
+        result = subprocess.run([jing, str(schema), *map(str, paths)])
+        if result.returncode != 0:
+            returncode = result.returncode
+    return returncode
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate ODF XML with jing")
+    parser.add_argument("xml_file", help="Path to XML file (content.xml, styles.xml, or manifest.xml)")
+    parser.add_argument("--schema", help="Path to RNG schema (optional)")
+    args = parser.parse_args(argv)
+
+    return validate(Path(args.xml_file), Path(args.schema) if args.schema else None)
 
 
 if __name__ == "__main__":
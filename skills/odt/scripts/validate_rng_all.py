@@ -4,21 +4,13 @@
 from __future__ import annotations
 
 import argparse
-import runpy
 import sys
 from pathlib import Path
 
-
-def _run(script: Path, args: list[str]) -> int:
-    old_argv = sys.argv
-    try:
-        sys.argv = [str(script)] + args
-        runpy.run_path(str(script), run_name="__main__")
-    except SystemExit as exc:
-        return int(exc.code or 0)
-    finally:
-        sys.argv = old_argv
-    return 0
+try:
+    from scripts.validate_rng import validate_files
+except ImportError:  # run directly as scripts/validate_rng_all.py
+    from validate_rng import validate_files
 
 
 def main() -> int:
@@ -31,9 +23,6 @@ def main() -> int:
         print(f"Not a directory: {base}", file=sys.stderr)
         return 1
 
-    scripts_dir = Path(__file__).resolve().parent
-    validator = scripts_dir / "validate_rng.py"
-
     targets = [
         base / "content.xml",
         base / "styles.xml",
@@ -41,14 +30,17 @@ def main() -> int:
     ]
 
     failed = False
+    present = []
     for xml_path in targets:
         if not xml_path.is_file():
             print(f"Missing file: {xml_path}", file=sys.stderr)
             failed = True
             continue
-        code = _run(validator, [str(xml_path)])
-        if code != 0:
-            failed = True
+        present.append(xml_path)
+
+    # Files sharing a schema go through a single jing (JVM) launch
+    if present and validate_files(present) != 0:
+        failed = True
 
     return 1 if failed else 0
 
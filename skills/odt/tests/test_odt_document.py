@@ -0,0 +1,104 @@
+"""Tests for ODTDocument manifest handling."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+# Load the scripts package by path under a unique name: the IDML skill also
+# has a top-level ``scripts`` package, so the two would collide in one run.
+# odt_document imports ``.utilities`` relatively, so it needs a package.
+_scripts_dir = Path(__file__).resolve().parents[1] / "scripts"
+_spec = importlib.util.spec_from_file_location(
+    "odt_scripts",
+    _scripts_dir / "__init__.py",
+    submodule_search_locations=[str(_scripts_dir)],
+)
+_package = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _package
+_spec.loader.exec_module(_package)
+_odt_document = importlib.import_module("odt_scripts.odt_document")
+MANIFEST_NS = _odt_document.MANIFEST_NS
+ODT_MIMETYPE = _odt_document.ODT_MIMETYPE
+ODTDocument = _odt_document.ODTDocument
+validate_odt = importlib.import_module("odt_scripts.validate_odt")
+
+_MANIFEST = f"""<?xml version="1.0" encoding="UTF-8"?>
+<manifest:manifest xmlns:manifest="{MANIFEST_NS}" manifest:version="1.3">
+ <manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>
+</manifest:manifest>
+"""
+
+
+class SaveManifestTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "META-INF").mkdir()
+        (self.root / "META-INF" / "manifest.xml").write_text(_MANIFEST, encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_save_adds_missing_root_entry(self):
+        # The manifest is never touched before save(); the root entry is still repaired
+        ODTDocument(self.root).save()
+
+        tree = ET.parse(self.root / "META-INF" / "manifest.xml")
+        entries = {
+            elem.get(f"{{{MANIFEST_NS}}}full-path"): elem.get(f"{{{MANIFEST_NS}}}media-type")
+            for elem in tree.getroot().iter(f"{{{MANIFEST_NS}}}file-entry")
+        }
+        self.assertEqual(entries["/"], ODT_MIMETYPE)
+        self.assertEqual(entries["content.xml"], "text/xml")
+
+
+class ValidateWithManifestTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / "unpacked"
+        (self.root / "META-INF").mkdir(parents=True)
+        manifest = _MANIFEST.replace(
+            " <manifest:file-entry",
+            f' <manifest:file-entry manifest:full-path="/" manifest:media-type="{ODT_MIMETYPE}"/>\n'
+            " <manifest:file-entry",
+            1,
+        )
+        (self.root / "META-INF" / "manifest.xml").write_text(manifest, encoding="utf-8")
+        self.odt = Path(self._tmp.name) / "doc.odt"
+        with zipfile.ZipFile(self.odt, "w") as zf:
+            zf.writestr("mimetype", ODT_MIMETYPE)
+            for name in ("content.xml", "Pictures/a.png", "META-INF/manifest.xml"):
+                zf.writestr(name, "x", compress_type=zipfile.ZIP_DEFLATED)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _validate(self, **kwargs) -> tuple[int, str]:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = validate_odt.validate(self.root, self.odt, **kwargs)
+        return code, out.getvalue()
+
+    def test_validate_checks_the_in_memory_manifest(self):
+        odt = ODTDocument(self.root)
+        # Declared in memory only; manifest.xml on disk does not list it yet
+        odt.ensure_manifest_entry("Pictures/a.png", "image/png")
+
+        self.assertEqual(self._validate(manifest=odt.manifest), (0, "ODT validation PASSED.\n"))
+
+        code, output = self._validate()
+        self.assertEqual(code, 1)
+        self.assertIn("- Manifest missing file entry for: Pictures/a.png\n", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
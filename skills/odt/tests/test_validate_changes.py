@@ -0,0 +1,72 @@
+"""Tests for validate_changes' streaming tracked-changes check."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Loaded by path: the IDML skill also has a top-level ``scripts`` package
+_spec = importlib.util.spec_from_file_location(
+    "odt_validate_changes", Path(__file__).resolve().parents[1] / "scripts" / "validate_changes.py"
+)
+validate_changes = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = validate_changes
+_spec.loader.exec_module(validate_changes)
+
+# ct2's deletion holds a marker and a nested changed-region, and another
+# changed-region sits outside text:tracked-changes; neither nested region
+# defines a change-id
+_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">
+<office:body><office:text>
+<text:tracked-changes>
+<text:changed-region text:id="ct1"><text:insertion/></text:changed-region>
+<text:changed-region text:id="ct2"><text:deletion><text:p>gone <text:change text:change-id="ct4"/></text:p><text:changed-region text:id="ctNested"/></text:deletion></text:changed-region>
+<text:changed-region text:id="ct3"><text:format-change/></text:changed-region>
+<text:changed-region text:id="ct4"><text:insertion/></text:changed-region>
+</text:tracked-changes>
+<text:section><text:changed-region text:id="ctStray"/></text:section>
+<text:p><text:span><text:change-start text:change-id="ct1"/>new<text:change-end text:change-id="ct1"/></text:span><text:change text:change-id="ct2"/></text:p>
+<text:p><text:change-start text:change-id="ctStray"/>open</text:p>
+<text:p><text:change-start text:change-id="ctNested"/><text:change-end text:change-id="ctNested"/><text:change-start/></text:p>
+</office:text></office:body>
+</office:document-content>
+"""
+
+# What the earlier findall-based check printed for the same content.xml
+_EXPECTED = """Tracked-changes validation FAILED:
+
+- Marker references unknown change-id: ctStray
+- Marker references unknown change-id: ctNested
+- Marker references unknown change-id: ctNested
+
+Warnings:
+- Change-id ctStray has 1 start marker(s) but only 0 end marker(s)
+- Change-id ct3 is defined but never referenced in content
+"""
+
+
+class ValidateChangesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.content_xml = Path(self._tmp.name) / "content.xml"
+        self.content_xml.write_text(_CONTENT, encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_nested_changed_regions_match_findall_check(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = validate_changes.validate(self.content_xml)
+        self.assertEqual(code, 1)
+        self.assertEqual(out.getvalue(), _EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for validate_odt's streaming manifest check."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+# Loaded by path: the IDML skill also has a top-level ``scripts`` package
+_spec = importlib.util.spec_from_file_location(
+    "odt_validate_odt", Path(__file__).resolve().parents[1] / "scripts" / "validate_odt.py"
+)
+validate_odt = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = validate_odt
+_spec.loader.exec_module(validate_odt)
+
+_MANIFEST_HEAD = f"""<?xml version="1.0" encoding="UTF-8"?>
+<manifest:manifest xmlns:manifest="{validate_odt.MANIFEST_NS}" manifest:version="1.3">
+"""
+
+
+def _entry(full_path: str, media_type: str) -> str:
+    return f' <manifest:file-entry manifest:full-path="{full_path}" manifest:media-type="{media_type}"/>\n'
+
+
+class ValidateManifestTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.unpacked = root / "unpacked"
+        (self.unpacked / "META-INF").mkdir(parents=True)
+        # Deflated and not first, so the mimetype checks fire as well
+        self.odt = root / "doc.odt"
+        with zipfile.ZipFile(self.odt, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name in ("content.xml", "mimetype", "styles.xml", "meta.xml", "META-INF/manifest.xml"):
+                zf.writestr(name, "<x/>")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _validate(self, *entries: str) -> tuple[int, str]:
+        manifest = _MANIFEST_HEAD + "".join(entries) + "</manifest:manifest>\n"
+        (self.unpacked / "META-INF" / "manifest.xml").write_text(manifest, encoding="utf-8")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = validate_odt.validate(self.unpacked, self.odt, verbose=True)
+        return code, out.getvalue()
+
+    def test_manifest_without_root_entry_matches_parsed_check(self):
+        code, output = self._validate(
+            _entry("content.xml", "text/xml"),
+            _entry("/styles.xml", "text/xml"),
+            _entry("Pictures/", ""),
+            _entry("Pictures/gone.png", "image/png"),
+            _entry("mimetype", "text/plain"),
+            _entry("META-INF/manifest.xml", "text/xml"),
+        )
+        # What the earlier ET.parse + findall check printed for the same package
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            output,
+            "ODT validation FAILED:\n\n"
+            "- Manifest missing root entry '/'\n"
+            "- Manifest should not list META-INF/manifest.xml\n"
+            "- Manifest should not list mimetype\n"
+            "- mimetype must be the first ZIP entry\n"
+            "- mimetype must be stored uncompressed\n"
+            "- Manifest missing file entry for: meta.xml\n"
+            "- Manifest references missing file: Pictures/gone.png\n",
+        )
+
+    def test_first_root_entry_wins(self):
+        code, output = self._validate(
+            _entry("/", "text/plain"),
+            _entry("/", validate_odt.ODT_MIMETYPE),
+            _entry("content.xml", "text/xml"),
+            _entry("styles.xml", "text/xml"),
+            _entry("meta.xml", "text/xml"),
+        )
+        self.assertEqual(code, 1)
+        self.assertIn(
+            f"- Root media type should be '{validate_odt.ODT_MIMETYPE}', got 'text/plain'\n", output
+        )
+        self.assertNotIn("Manifest missing", output)
+
+
+if __name__ == "__main__":
+    unittest.main()